@@ -14,10 +14,39 @@ Usage:
 import os
 import json
 import time
+import hashlib
+import asyncio
+import threading
+import weakref
 import requests
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional, Any, Tuple, Callable, Iterable, Iterator
+from dataclasses import dataclass, field, asdict, replace
 from enum import Enum
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # Async API unavailable
+
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None  # Semantic cache unavailable
+
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    # Fall back to stdlib json (slower encode/decode)
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+    _loads = json.loads
 
 
 class ProviderType(Enum):
@@ -26,14 +55,19 @@ class ProviderType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelConfig:
     id: str
     name: str
     cost: float  # Cost per 1K tokens
+    completions: bool = False  # Served by the provider's prompt-list batch endpoint
+    cost_per_token: float = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.cost_per_token = self.cost / 1000.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderConfig:
     id: str
     name: str
@@ -43,9 +77,17 @@ class ProviderConfig:
     default_model: str
     requires_key: bool
     key_name: Optional[str] = None
+    supports_batch_prompts: bool = False  # Accepts a list of prompts in one request
+    batch_endpoint: Optional[str] = None
+    _model_index: Dict[str, ModelConfig] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._model_index = {m.id: m for m in self.models}
+        if self.batch_endpoint is None and any(m.completions for m in self.models):
+            raise ValueError(f"{self.name}: completions models need a batch_endpoint")
     
     
-@dataclass
+@dataclass(slots=True)
 class GenerationResult:
     text: str
     model: str
@@ -58,16 +100,354 @@ class GenerationResult:
     used_fallback: bool = False
 
 
+def _copy_result(result: GenerationResult, **changes) -> GenerationResult:
+    """Copy of a result that shares no mutable state with the original"""
+    return replace(result, usage=dict(result.usage), **changes)
+
+
+class SemanticCache:
+    """Fixed-size cache of responses keyed by prompt embedding.
+    
+    Embeddings are L2-normalized at insert time, so cosine similarity
+    against every entry is a single matrix-vector product. Entries only
+    match within the same scope (provider, model, max_tokens); the least
+    recently used entry is overwritten once the cache is full.
+    """
+    
+    def __init__(self, model_name: str, threshold: float = 0.92, max_entries: int = 1024):
+        self.encoder = SentenceTransformer(model_name)
+        self.threshold = threshold
+        self.max_entries = max_entries
+        
+        dim = self.encoder.get_sentence_embedding_dimension()
+        self._embeddings = np.zeros((max_entries, dim), dtype=np.float32)
+        self._scope_ids = np.full(max_entries, -1, dtype=np.int32)
+        self._last_used = np.zeros(max_entries, dtype=np.int64)
+        self._results: List[Optional[GenerationResult]] = [None] * max_entries
+        self._scopes: Dict[Tuple, int] = {}
+        self._size = 0
+        self._tick = 0
+        self._lock = threading.Lock()
+        
+    def embed(self, prompt: str) -> "np.ndarray":
+        return self.encoder.encode(
+            prompt, normalize_embeddings=True, convert_to_numpy=True
+        ).astype(np.float32, copy=False)
+        
+    def lookup(self, scope: Tuple, embedding: "np.ndarray") -> Optional[GenerationResult]:
+        with self._lock:
+            scope_id = self._scopes.get(scope)
+            if scope_id is None or self._size == 0:
+                return None
+            
+            sims = self._embeddings[:self._size] @ embedding
+            sims[self._scope_ids[:self._size] != scope_id] = -1.0
+            best = int(np.argmax(sims))
+            if sims[best] < self.threshold:
+                return None
+            
+            self._tick += 1
+            self._last_used[best] = self._tick
+            return self._results[best]
+        
+    def store(self, scope: Tuple, embedding: "np.ndarray", result: GenerationResult):
+        with self._lock:
+            if self._size < self.max_entries:
+                slot = self._size
+                self._size += 1
+            else:
+                slot = int(np.argmin(self._last_used))
+            
+            self._tick += 1
+            self._embeddings[slot] = embedding
+            self._scope_ids[slot] = self._scopes.setdefault(scope, len(self._scopes))
+            self._last_used[slot] = self._tick
+            self._results[slot] = result
+
+
+# ============================================================================
+# PROVIDER HANDLERS
+# ============================================================================
+# Header factories return the static headers for an API key; the engine
+# keeps one template per provider. Request builders return
+# (endpoint, headers, body); response parsers return (text, usage, stop_reason).
+
+def _headers_claude(api_key):
+    return {
+        'Content-Type': 'application/json',
+        'x-api-key': api_key,
+        'anthropic-version': '2023-06-01'
+    }
+
+
+def _headers_openai(api_key):
+    return {
+        'Content-Type': 'application/json',
+        'Authorization': f'Bearer {api_key}'
+    }
+
+
+def _headers_json(api_key):
+    return {'Content-Type': 'application/json'}
+
+
+def _build_claude(provider, model_id, api_key, headers, prompt, max_tokens, temperature):
+    body = {
+        'model': model_id,
+        'max_tokens': max_tokens,
+        'messages': [{'role': 'user', 'content': prompt}],
+        'temperature': temperature
+    }
+    return provider.endpoint, headers, body
+
+
+def _build_openai(provider, model_id, api_key, headers, prompt, max_tokens, temperature):
+    model_config = provider._model_index.get(model_id)
+    if model_config and model_config.completions:
+        # Completions-only models take a bare prompt on the legacy endpoint
+        body = {
+            'model': model_id,
+            'prompt': prompt,
+            'max_tokens': max_tokens,
+            'temperature': temperature
+        }
+        return provider.batch_endpoint, headers, body
+    
+    body = {
+        'model': model_id,
+        'messages': [{'role': 'user', 'content': prompt}],
+        'max_tokens': max_tokens,
+        'temperature': temperature
+    }
+    return provider.endpoint, headers, body
+
+
+def _build_gemini(provider, model_id, api_key, headers, prompt, max_tokens, temperature):
+    endpoint = f"{provider.endpoint}/{model_id}:generateContent?key={api_key}"
+    body = {
+        'contents': [{'parts': [{'text': prompt}]}],
+        'generationConfig': {
+            'maxOutputTokens': max_tokens,
+            'temperature': temperature
+        }
+    }
+    return endpoint, headers, body
+
+
+def _build_ollama(provider, model_id, api_key, headers, prompt, max_tokens, temperature):
+    body = {
+        'model': model_id,
+        'prompt': prompt,
+        'stream': False,
+        'options': {
+            'temperature': temperature,
+            'num_predict': max_tokens
+        }
+    }
+    return provider.endpoint, headers, body
+
+
+def _parse_claude(data):
+    return data['content'][0]['text'], data['usage'], data['stop_reason']
+
+
+def _parse_openai(data):
+    choice = data['choices'][0]
+    # Chat completions carry a message; legacy completions carry text
+    text = choice['message']['content'] if 'message' in choice else choice['text']
+    return text, data['usage'], choice['finish_reason']
+
+
+def _parse_gemini(data):
+    candidate = data['candidates'][0]
+    return (candidate['content']['parts'][0]['text'],
+            data.get('usageMetadata', {}),
+            candidate['finishReason'])
+
+
+def _parse_ollama(data):
+    prompt_tokens = data.get('prompt_eval_count', 0)
+    completion_tokens = data.get('eval_count', 0)
+    usage = {
+        'prompt_tokens': prompt_tokens,
+        'completion_tokens': completion_tokens,
+        'total_tokens': prompt_tokens + completion_tokens
+    }
+    return data['response'], usage, 'complete' if data.get('done') else 'length'
+
+
+def _split_usage(usage: Dict, n: int) -> List[Dict]:
+    """
+    Divide one request's usage across its n prompts.
+    
+    Integer counts are split so the per-prompt values sum to the reported
+    total (the first prompts take the remainder); nested breakdowns such as
+    completion_tokens_details and other values are carried through as-is.
+    """
+    shares = [{} for _ in range(n)]
+    for key, value in usage.items():
+        if isinstance(value, int) and not isinstance(value, bool):
+            base, extra = divmod(value, n)
+            for i, share in enumerate(shares):
+                share[key] = base + (i < extra)
+        else:
+            for share in shares:
+                share[key] = value
+    return shares
+
+
+# Stream parsers consume raw response lines, call on_token for each text
+# fragment and return (text, usage, stop_reason) like the parsers above.
+
+def _sse_events(lines: Iterable[bytes]):
+    """Yield decoded JSON payloads from Server-Sent Events 'data:' lines"""
+    for line in lines:
+        if not line.startswith(b'data:'):
+            continue
+        payload = line[5:].strip()
+        if payload == b'[DONE]':
+            return
+        yield _loads(payload)
+
+
+def _stream_claude(lines, on_token):
+    parts, usage, stop_reason = [], {}, 'end_turn'
+    for event in _sse_events(lines):
+        kind = event.get('type')
+        if kind == 'content_block_delta' and event['delta'].get('type') == 'text_delta':
+            token = event['delta']['text']
+            parts.append(token)
+            on_token(token)
+        elif kind == 'message_start':
+            usage.update(event['message'].get('usage', {}))
+        elif kind == 'message_delta':
+            usage.update(event.get('usage', {}))
+            stop_reason = event['delta'].get('stop_reason') or stop_reason
+    return ''.join(parts), usage, stop_reason
+
+
+def _stream_openai(lines, on_token):
+    parts, usage, stop_reason = [], {}, 'stop'
+    for event in _sse_events(lines):
+        if event.get('usage'):
+            usage = event['usage']
+        for choice in event.get('choices', ()):
+            token = choice['delta'].get('content') if 'delta' in choice else choice.get('text')
+            if token:
+                parts.append(token)
+                on_token(token)
+            stop_reason = choice.get('finish_reason') or stop_reason
+    return ''.join(parts), usage, stop_reason
+
+
+def _stream_ollama(lines, on_token):
+    parts, final = [], {}
+    for line in lines:
+        if not line:
+            continue
+        chunk = _loads(line)
+        token = chunk.get('response')
+        if token:
+            parts.append(token)
+            on_token(token)
+        if chunk.get('done'):
+            final = chunk
+    _, usage, stop_reason = _parse_ollama({**final, 'response': ''})
+    return ''.join(parts), usage, stop_reason
+
+
 class AIProviderEngine:
     """Universal AI provider engine with multi-backend support"""
     
+    _HEADER_FACTORIES = {
+        'claude': _headers_claude,
+        'openai': _headers_openai,
+        'gemini': _headers_json,
+        'ollama': _headers_json,
+    }
+    
+    _REQUEST_BUILDERS = {
+        'claude': _build_claude,
+        'openai': _build_openai,
+        'gemini': _build_gemini,
+        'ollama': _build_ollama,
+    }
+    
+    _RESPONSE_PARSERS = {
+        'claude': _parse_claude,
+        'openai': _parse_openai,
+        'gemini': _parse_gemini,
+        'ollama': _parse_ollama,
+    }
+    
+    # Providers with a streaming mode: (extra body fields, stream parser)
+    _STREAM_HANDLERS = {
+        'claude': ({'stream': True}, _stream_claude),
+        'openai': ({'stream': True, 'stream_options': {'include_usage': True}}, _stream_openai),
+        'ollama': ({'stream': True}, _stream_ollama),
+    }
+    
     def __init__(self):
         self.providers: Dict[str, ProviderConfig] = {}
         self.api_keys: Dict[str, str] = {}
+        self._header_templates: Dict[str, Tuple[Optional[str], Dict]] = {}  # provider_id -> (api_key, headers)
         self.active_provider: Optional[Dict] = None
         self.fallback_chain: List[str] = []
         self.costs: Dict[str, Dict] = {}
-        self.request_history: List[Dict] = []
+        self.request_history: deque = deque(maxlen=100)
+        self._stats_snapshot: Optional[Dict] = None  # Rebuilt lazily by get_stats()
+        
+        # Exact-match LRU cache for deterministic (temperature ~ 0) requests
+        self._cache: "OrderedDict[str, GenerationResult]" = OrderedDict()
+        self._cache_max = 512
+        self.cache_stats = {'hits': 0, 'semantic_hits': 0, 'misses': 0}
+        
+        # Embedding-similarity cache, off until enable_semantic_cache()
+        self._semantic_cache: Optional["SemanticCache"] = None
+        
+        # Guards usage stats, history and the response cache across threads
+        self._stats_lock = threading.Lock()
+        
+        # Pooled keep-alive session shared by all provider calls. Only
+        # 429/5xx answers are retried: a connect or read error on a POST
+        # may already have reached the provider, and resending it could
+        # bill the same completion twice
+        self._session = requests.Session()
+        self._session.headers['Connection'] = 'keep-alive'
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=None,
+                connect=0,
+                read=0,
+                other=0,
+                status=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=['GET', 'POST'],
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        
+        # Availability probes get a separate session without retries so
+        # an unreachable or overloaded local server fails fast
+        self._probe_session = requests.Session()
+        
+        # Seconds to skip a fallback provider after it answered 429
+        self.rate_limit_cooldown = 30.0
+        
+        # test_provider() results: provider_id -> (available, checked_at)
+        self._avail_cache: Dict[str, Tuple[bool, float]] = {}
+        self._avail_ttl = 30.0
+        
+        # Async clients for agenerate(), one per event loop (an
+        # httpx.AsyncClient's connections are bound to the loop that made them)
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = \
+            weakref.WeakKeyDictionary()
         
         self._register_builtin_providers()
         
@@ -100,10 +480,14 @@ class AIProviderEngine:
                 ModelConfig('gpt-4-turbo-preview', 'GPT-4 Turbo', 0.01),
                 ModelConfig('gpt-4', 'GPT-4', 0.03),
                 ModelConfig('gpt-3.5-turbo', 'GPT-3.5 Turbo', 0.0005),
+                ModelConfig('gpt-3.5-turbo-instruct', 'GPT-3.5 Turbo Instruct', 0.0015,
+                            completions=True),
             ],
             default_model='gpt-4-turbo-preview',
             requires_key=True,
-            key_name='OPENAI_API_KEY'
+            key_name='OPENAI_API_KEY',
+            supports_batch_prompts=True,
+            batch_endpoint='https://api.openai.com/v1/completions'
         ))
         
         # Gemini (Google)
@@ -144,15 +528,26 @@ class AIProviderEngine:
         
     def register_provider(self, config: ProviderConfig):
         """Register a new provider"""
+        if not (config.id in self._HEADER_FACTORIES and
+                config.id in self._REQUEST_BUILDERS and
+                config.id in self._RESPONSE_PARSERS):
+            raise ValueError(f"Unsupported provider: {config.id}")
+        
         self.providers[config.id] = config
+        self._avail_cache.pop(config.id, None)
+        
+        # Re-index models in case the list was edited after construction
+        config._model_index = {m.id: m for m in config.models}
         
         # Initialize cost tracking
+        self._stats_snapshot = None
         if config.id not in self.costs:
             self.costs[config.id] = {
                 'total_requests': 0,
                 'total_tokens': 0,
                 'total_cost': 0.0,
-                'avg_response_time': 0.0
+                'avg_response_time': 0.0,
+                'last_429_ts': 0.0
             }
             
     def set_api_key(self, provider_id: str, api_key: str):
@@ -161,6 +556,8 @@ class AIProviderEngine:
             raise ValueError(f"Unknown provider: {provider_id}")
         
         self.api_keys[provider_id] = api_key
+        self._avail_cache.pop(provider_id, None)
+        self._headers_for(provider_id, api_key)
         print(f"✓ API key set for {self.providers[provider_id].name}")
         
     def get_api_key(self, provider_id: str) -> Optional[str]:
@@ -200,7 +597,17 @@ class AIProviderEngine:
         print(f"✓ Fallback chain: {' → '.join(provider_ids)}")
         
     def test_provider(self, provider_id: str) -> bool:
-        """Test if provider is available"""
+        """Test if provider is available (results are reused for 30s)"""
+        cached = self._avail_cache.get(provider_id)
+        if cached is not None and time.monotonic() - cached[1] < self._avail_ttl:
+            return cached[0]
+        
+        available = self._probe_provider(provider_id)
+        self._avail_cache[provider_id] = (available, time.monotonic())
+        return available
+        
+    def _probe_provider(self, provider_id: str) -> bool:
+        """Internal: Check key requirement and local endpoint reachability"""
         provider = self.providers.get(provider_id)
         if not provider:
             return False
@@ -215,24 +622,25 @@ class AIProviderEngine:
         # For local providers, test endpoint
         if provider.type == ProviderType.LOCAL:
             try:
-                response = requests.get(
+                response = self._probe_session.get(
                     provider.endpoint.replace('/api/generate', '/api/tags'),
                     timeout=2
                 )
                 return response.ok
-            except:
-                print(f"⚠️ {provider.name}: Not running locally")
+            except requests.exceptions.RequestException as error:
+                print(f"⚠️ {provider.name}: Not running locally ({error.__class__.__name__})")
                 return False
         
         return True
         
     def auto_detect_provider(self) -> List[str]:
         """Auto-detect available providers"""
-        available = []
+        # Probe all providers concurrently (local probes block on the network)
+        provider_ids = list(self.providers)
+        with ThreadPoolExecutor(max_workers=max(1, len(provider_ids))) as executor:
+            results = executor.map(self.test_provider, provider_ids)
         
-        for provider_id in self.providers:
-            if self.test_provider(provider_id):
-                available.append(provider_id)
+        available = [pid for pid, ok in zip(provider_ids, results) if ok]
         
         print(f"✓ Available providers: {', '.join(available)}")
         
@@ -255,6 +663,11 @@ class AIProviderEngine:
         if not self.active_provider:
             raise ValueError("No active provider. Call set_active_provider() first.")
         
+        # Only deterministic requests are safe to serve from cache
+        cache_entry, cached = self._cache_lookup(prompt, max_tokens, temperature, model)
+        if cached is not None:
+            return cached
+        
         start_time = time.time()
         
         try:
@@ -268,6 +681,7 @@ class AIProviderEngine:
             
             result.response_time = time.time() - start_time
             self._track_usage(self.active_provider['id'], result)
+            self._cache_store(cache_entry, self.active_provider['id'], result)
             
             return result
             
@@ -282,6 +696,10 @@ class AIProviderEngine:
                     if fallback_id == self.active_provider['id']:
                         continue
                     
+                    if self._rate_limited(fallback_id):
+                        print(f"→ Skipping {self.providers[fallback_id].name} (rate limited)")
+                        continue
+                    
                     try:
                         result = self._generate_with_provider(
                             fallback_id,
@@ -294,6 +712,7 @@ class AIProviderEngine:
                         result.response_time = time.time() - start_time
                         result.used_fallback = True
                         self._track_usage(fallback_id, result)
+                        self._cache_store(cache_entry, fallback_id, result)
                         
                         print(f"✓ Fallback successful: {self.providers[fallback_id].name}")
                         return result
@@ -304,15 +723,118 @@ class AIProviderEngine:
             
             raise Exception(f"All providers failed. Last error: {error}")
             
-    def _generate_with_provider(
+    def generate_stream(
         self,
-        provider_id: str,
         prompt: str,
+        on_token: Optional[Callable[[str], None]] = None,
         max_tokens: int = 4000,
         temperature: float = 1.0,
         model: Optional[str] = None
     ) -> GenerationResult:
-        """Internal: Generate with specific provider"""
+        """
+        Generate with the active provider, passing text to on_token as it arrives.
+        
+        Providers without a streaming mode deliver the whole text in one
+        on_token call. Without on_token this is a buffered generate().
+        Tokens cannot be taken back once delivered, so there is no
+        fallback chain and no response caching.
+        """
+        if on_token is None:
+            return self.generate(prompt, max_tokens=max_tokens,
+                                 temperature=temperature, model=model)
+        
+        if not self.active_provider:
+            raise ValueError("No active provider. Call set_active_provider() first.")
+        
+        provider_id = self.active_provider['id']
+        handler = self._STREAM_HANDLERS.get(provider_id)
+        start_time = time.time()
+        
+        if handler is None:
+            result = self._generate_with_provider(
+                provider_id, prompt, max_tokens=max_tokens,
+                temperature=temperature, model=model
+            )
+            on_token(result.text)
+        else:
+            stream_fields, parse_stream = handler
+            endpoint, headers, body = self._build_request(
+                provider_id, prompt, max_tokens, temperature, model
+            )
+            body = {**body, **stream_fields}
+            
+            with self._session.post(endpoint, headers=headers, data=_dumps(body),
+                                    timeout=60, stream=True) as response:
+                if not response.ok:
+                    self._raise_api_error(provider_id, response.status_code, response.text)
+                text, usage, stop_reason = parse_stream(response.iter_lines(), on_token)
+            
+            result = self._make_result(provider_id, model, text, usage, stop_reason)
+        
+        result.response_time = time.time() - start_time
+        self._track_usage(provider_id, result)
+        return result
+        
+    def generate_batch(
+        self,
+        prompts: List[str],
+        max_workers: int = 8,
+        **kwargs
+    ) -> List[GenerationResult]:
+        """
+        Generate responses for many prompts concurrently.
+        
+        Providers that accept a list of prompts per request (legacy
+        completions models) are sent chunks of up to 20 prompts per HTTP
+        call. Otherwise, and for any chunks still outstanding when a batch
+        request fails, each prompt goes through generate() on a thread pool
+        sharing the pooled session. Results are returned in input order.
+        """
+        results: List[GenerationResult] = []
+        
+        if self.active_provider:
+            provider = self.active_provider['config']
+            model_config = provider._model_index.get(
+                kwargs.get('model') or provider.default_model
+            )
+            if provider.supports_batch_prompts and model_config and model_config.completions:
+                try:
+                    # Completed chunks are kept (they are already billed)
+                    for chunk_results in self._generate_batch_native(
+                        self.active_provider['id'],
+                        prompts,
+                        max_tokens=kwargs.get('max_tokens', 4000),
+                        temperature=kwargs.get('temperature', 1.0),
+                        model=model_config.id
+                    ):
+                        results.extend(chunk_results)
+                except Exception as error:
+                    print(f"Batch request to {provider.name} failed: {error}")
+                    print("→ Falling back to per-prompt requests...")
+        
+        remaining = prompts[len(results):]
+        if remaining:
+            with ThreadPoolExecutor(max_workers=max_workers) as ex:
+                futures = [ex.submit(self.generate, p, **kwargs) for p in remaining]
+                results.extend(f.result() for f in futures)
+        
+        return results
+            
+    def _generate_batch_native(
+        self,
+        provider_id: str,
+        prompts: List[str],
+        max_tokens: int = 4000,
+        temperature: float = 1.0,
+        model: Optional[str] = None,
+        chunk_size: int = 20
+    ) -> Iterator[List[GenerationResult]]:
+        """
+        Internal: Send prompts to a provider's prompt-list endpoint in chunks.
+        
+        Yields each chunk's results (in prompt order) as soon as it is
+        tracked, so a caller keeps finished chunks if a later one raises.
+        """
         
         provider = self.providers[provider_id]
         model_id = model or provider.default_model
@@ -321,96 +843,265 @@ class AIProviderEngine:
         if provider.requires_key and not api_key:
             raise ValueError(f"{provider.name} requires API key")
         
-        # Format request based on provider
-        if provider_id == 'claude':
-            headers = {
-                'Content-Type': 'application/json',
-                'x-api-key': api_key,
-                'anthropic-version': '2023-06-01'
-            }
+        model_config = provider._model_index.get(model_id)
+        headers = self._headers_for(provider_id, api_key)
+        
+        for start in range(0, len(prompts), chunk_size):
+            chunk = prompts[start:start + chunk_size]
             body = {
                 'model': model_id,
+                'prompt': chunk,
                 'max_tokens': max_tokens,
-                'messages': [{'role': 'user', 'content': prompt}],
                 'temperature': temperature
             }
             
-        elif provider_id == 'openai':
-            headers = {
-                'Content-Type': 'application/json',
-                'Authorization': f'Bearer {api_key}'
-            }
-            body = {
-                'model': model_id,
-                'messages': [{'role': 'user', 'content': prompt}],
-                'max_tokens': max_tokens,
-                'temperature': temperature
-            }
+            start_time = time.time()
+            response = self._session.post(
+                provider.batch_endpoint, headers=headers, data=_dumps(body), timeout=60
+            )
             
-        elif provider_id == 'gemini':
-            headers = {'Content-Type': 'application/json'}
-            endpoint = f"{provider.endpoint}/{model_id}:generateContent?key={api_key}"
-            body = {
-                'contents': [{'parts': [{'text': prompt}]}],
-                'generationConfig': {
-                    'maxOutputTokens': max_tokens,
-                    'temperature': temperature
-                }
-            }
+            if not response.ok:
+                self._raise_api_error(provider_id, response.status_code, response.text)
             
-        elif provider_id == 'ollama':
-            headers = {'Content-Type': 'application/json'}
-            body = {
-                'model': model_id,
-                'prompt': prompt,
-                'stream': False,
-                'options': {
-                    'temperature': temperature,
-                    'num_predict': max_tokens
-                }
-            }
+            data = _loads(response.content)
+            elapsed = time.time() - start_time
             
-        else:
-            raise ValueError(f"Unsupported provider: {provider_id}")
+            # Choices may arrive in any order; index maps back to the prompt
+            choices = sorted(data['choices'], key=lambda c: c['index'])
+            if len(choices) != len(chunk):
+                raise Exception(f"Batch response has {len(choices)} choices for {len(chunk)} prompts")
+            
+            # Usage is reported per request; split it across the prompts
+            usages = _split_usage(data.get('usage', {}), len(choices))
+            
+            results: List[GenerationResult] = []
+            for choice, usage in zip(choices, usages):
+                cost = (usage.get('total_tokens', 0) * model_config.cost_per_token) if model_config else 0
+                result = GenerationResult(
+                    text=choice['text'],
+                    model=model_id,
+                    provider=provider_id,
+                    provider_name=provider.name,
+                    usage=usage,
+                    cost=cost,
+                    response_time=elapsed,
+                    stop_reason=choice.get('finish_reason')
+                )
+                self._track_usage(provider_id, result)
+                results.append(result)
+            
+            yield results
         
-        # Make request
-        endpoint = provider.endpoint if provider_id != 'gemini' else endpoint
-        response = requests.post(endpoint, headers=headers, json=body, timeout=60)
+    def _cache_key(
+        self,
+        provider_id: str,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        model: Optional[str]
+    ) -> str:
+        """SHA-256 of the canonical request payload as sent to provider_id"""
+        payload = json.dumps({
+            'p': provider_id,
+            'm': model or self.providers[provider_id].default_model,
+            't': temperature,
+            'mt': max_tokens,
+            'pr': prompt
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
         
-        if not response.ok:
-            raise Exception(f"API error ({response.status_code}): {response.text}")
+    def _cache_lookup(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        model: Optional[str]
+    ) -> Tuple[Optional[Tuple], Optional[GenerationResult]]:
+        """Check the exact-match and semantic caches.
         
-        data = response.json()
+        Returns (cache_entry, cached_result); cache_entry is passed to
+        _cache_store() on a miss and is None for uncacheable requests.
+        Lookups are for the active provider and the model it would use.
+        """
+        request, cached = self._exact_cache_lookup(prompt, max_tokens, temperature, model)
+        if request is None:
+            return None, cached
         
-        # Parse response based on provider
-        if provider_id == 'claude':
-            text = data['content'][0]['text']
-            usage = data['usage']
-            stop_reason = data['stop_reason']
-            
-        elif provider_id == 'openai':
-            text = data['choices'][0]['message']['content']
-            usage = data['usage']
-            stop_reason = data['choices'][0]['finish_reason']
+        embedding = None
+        if self._semantic_cache is not None:
+            embedding = self._semantic_cache.embed(prompt)
+        return self._semantic_cache_lookup(request, embedding)
+        
+    async def _acache_lookup(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        model: Optional[str]
+    ) -> Tuple[Optional[Tuple], Optional[GenerationResult]]:
+        """_cache_lookup() that encodes the prompt off the event loop"""
+        request, cached = self._exact_cache_lookup(prompt, max_tokens, temperature, model)
+        if request is None:
+            return None, cached
+        
+        embedding = None
+        if self._semantic_cache is not None:
+            embedding = await asyncio.to_thread(self._semantic_cache.embed, prompt)
+        return self._semantic_cache_lookup(request, embedding)
+        
+    def _exact_cache_lookup(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        model: Optional[str]
+    ) -> Tuple[Optional[Tuple], Optional[GenerationResult]]:
+        """Exact-match half of _cache_lookup().
+        
+        Returns (request, None) on a miss, (None, result) on a hit and
+        (None, None) for uncacheable requests.
+        """
+        if temperature > 0.01:
+            return None, None
+        
+        request = (prompt, max_tokens, temperature, model)
+        cache_key = self._cache_key(self.active_provider['id'], *request)
+        with self._stats_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
+                self.cache_stats['hits'] += 1
+                return None, _copy_result(cached, response_time=0)
+        
+        return request, None
+        
+    def _semantic_cache_lookup(
+        self,
+        request: Tuple,
+        embedding: Optional["np.ndarray"]
+    ) -> Tuple[Optional[Tuple], Optional[GenerationResult]]:
+        """Semantic half of _cache_lookup(), given the prompt embedding"""
+        cached = None
+        if embedding is not None:
+            prompt, max_tokens, temperature, model = request
+            scope = self._cache_scope(self.active_provider['id'], max_tokens, model)
+            cached = self._semantic_cache.lookup(scope, embedding)
+        
+        with self._stats_lock:
+            if cached is not None:
+                self.cache_stats['semantic_hits'] += 1
+            else:
+                self.cache_stats['misses'] += 1
+        
+        if cached is not None:
+            return None, _copy_result(cached, response_time=0)
+        return (request, embedding), None
+        
+    def _cache_scope(self, provider_id: str, max_tokens: int, model: Optional[str]) -> Tuple:
+        """Semantic-cache scope: (provider, resolved model, max_tokens)"""
+        return (provider_id, model or self.providers[provider_id].default_model, max_tokens)
+        
+    def _cache_store(
+        self,
+        cache_entry: Optional[Tuple],
+        provider_id: str,
+        result: GenerationResult
+    ):
+        """Store a copy of provider_id's result in the response caches.
+        
+        Entries are keyed on the provider that actually answered, so a
+        fallback response is only served while that provider is active
+        (and is then not marked used_fallback).
+        """
+        if cache_entry is None:
+            return
+        
+        request, embedding = cache_entry
+        prompt, max_tokens, temperature, model = request
+        cache_key = self._cache_key(provider_id, *request)
+        result = _copy_result(result, used_fallback=False)
+        with self._stats_lock:
+            self._cache[cache_key] = result
+            if len(self._cache) > self._cache_max:
+                self._cache.popitem(last=False)
+        
+        if embedding is not None:
+            self._semantic_cache.store(
+                self._cache_scope(provider_id, max_tokens, model), embedding, result
+            )
             
-        elif provider_id == 'gemini':
-            text = data['candidates'][0]['content']['parts'][0]['text']
-            usage = data.get('usageMetadata', {})
-            stop_reason = data['candidates'][0]['finishReason']
+    def enable_semantic_cache(
+        self,
+        model_name: str = 'all-MiniLM-L6-v2',
+        threshold: float = 0.92,
+        max_entries: int = 1024
+    ) -> bool:
+        """Also serve deterministic requests whose prompt paraphrases a cached one"""
+        if SentenceTransformer is None:
+            print("⚠️ Semantic cache unavailable (pip install sentence-transformers)")
+            return False
+        
+        self._semantic_cache = SemanticCache(model_name, threshold, max_entries)
+        print(f"✓ Semantic cache enabled ({model_name}, threshold {threshold})")
+        return True
             
-        elif provider_id == 'ollama':
-            text = data['response']
-            usage = {
-                'prompt_tokens': data.get('prompt_eval_count', 0),
-                'completion_tokens': data.get('eval_count', 0),
-                'total_tokens': (data.get('prompt_eval_count', 0) + 
-                               data.get('eval_count', 0))
-            }
-            stop_reason = 'complete' if data.get('done') else 'length'
+    def _build_request(
+        self,
+        provider_id: str,
+        prompt: str,
+        max_tokens: int = 4000,
+        temperature: float = 1.0,
+        model: Optional[str] = None
+    ) -> Tuple[str, Dict, Dict]:
+        """Internal: Build (endpoint, headers, body) for a provider request"""
+        
+        provider = self.providers[provider_id]
+        api_key = self.get_api_key(provider_id)
+        
+        if provider.requires_key and not api_key:
+            raise ValueError(f"{provider.name} requires API key")
+        
+        build = self._REQUEST_BUILDERS[provider_id]
+        return build(provider, model or provider.default_model, api_key,
+                     self._headers_for(provider_id, api_key),
+                     prompt, max_tokens, temperature)
+        
+    def _headers_for(self, provider_id: str, api_key: Optional[str]) -> Dict:
+        """Internal: Shared header template for a provider's current key (do not mutate)"""
+        template = self._header_templates.get(provider_id)
+        if template is None or template[0] != api_key:
+            # Keys can also come from the environment, so rebuild on change
+            template = (api_key, self._HEADER_FACTORIES[provider_id](api_key))
+            self._header_templates[provider_id] = template
+        return template[1]
+        
+    def _parse_response(
+        self,
+        provider_id: str,
+        model: Optional[str],
+        data: Dict
+    ) -> GenerationResult:
+        """Internal: Turn a provider's JSON response into a GenerationResult"""
+        
+        text, usage, stop_reason = self._RESPONSE_PARSERS[provider_id](data)
+        return self._make_result(provider_id, model, text, usage, stop_reason)
+        
+    def _make_result(
+        self,
+        provider_id: str,
+        model: Optional[str],
+        text: str,
+        usage: Dict,
+        stop_reason: str
+    ) -> GenerationResult:
+        """Internal: Price usage and wrap it in a GenerationResult"""
+        
+        provider = self.providers[provider_id]
+        model_id = model or provider.default_model
         
         # Calculate cost
-        model_config = next((m for m in provider.models if m.id == model_id), None)
-        cost = (usage.get('total_tokens', 0) / 1000 * model_config.cost) if model_config else 0
+        model_config = provider._model_index.get(model_id)
+        cost = (usage.get('total_tokens', 0) * model_config.cost_per_token) if model_config else 0
         
         return GenerationResult(
             text=text,
@@ -423,45 +1114,195 @@ class AIProviderEngine:
             stop_reason=stop_reason
         )
         
+    def _generate_with_provider(
+        self,
+        provider_id: str,
+        prompt: str,
+        max_tokens: int = 4000,
+        temperature: float = 1.0,
+        model: Optional[str] = None
+    ) -> GenerationResult:
+        """Internal: Generate with specific provider"""
+        
+        endpoint, headers, body = self._build_request(
+            provider_id, prompt, max_tokens, temperature, model
+        )
+        
+        # Make request
+        response = self._session.post(endpoint, headers=headers, data=_dumps(body), timeout=60)
+        
+        if not response.ok:
+            self._raise_api_error(provider_id, response.status_code, response.text)
+        
+        return self._parse_response(provider_id, model, _loads(response.content))
+        
+    def _raise_api_error(self, provider_id: str, status_code: int, text: str):
+        """Internal: Record rate limiting and raise for a failed response"""
+        if status_code == 429:
+            with self._stats_lock:
+                self.costs[provider_id]['last_429_ts'] = time.time()
+                self._stats_snapshot = None
+        
+        raise Exception(f"API error ({status_code}): {text}")
+        
+    def _rate_limited(self, provider_id: str) -> bool:
+        """Internal: Whether a provider is still cooling down after a 429"""
+        last_429 = self.costs[provider_id].get('last_429_ts', 0.0)
+        return time.time() - last_429 < self.rate_limit_cooldown
+        
+    # === ASYNC API ===
+    
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """Return the running event loop's async client, creating it on first use"""
+        if httpx is None:
+            raise ImportError("httpx is required for async generation (pip install httpx)")
+        
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            # Clients of loops that have since closed can no longer be used
+            for stale in [l for l in self._async_clients if l.is_closed()]:
+                del self._async_clients[stale]
+            
+            limits = httpx.Limits(max_connections=64, max_keepalive_connections=16)
+            try:
+                client = httpx.AsyncClient(http2=True, timeout=60, limits=limits)
+            except ImportError:
+                # HTTP/2 needs the optional h2 package
+                client = httpx.AsyncClient(timeout=60, limits=limits)
+            self._async_clients[loop] = client
+        
+        return client
+        
+    async def _agenerate_with_provider(
+        self,
+        provider_id: str,
+        prompt: str,
+        max_tokens: int = 4000,
+        temperature: float = 1.0,
+        model: Optional[str] = None
+    ) -> GenerationResult:
+        """Internal: Async generate with specific provider"""
+        
+        endpoint, headers, body = self._build_request(
+            provider_id, prompt, max_tokens, temperature, model
+        )
+        
+        response = await self._get_async_client().post(endpoint, headers=headers, content=_dumps(body))
+        
+        if not response.is_success:
+            self._raise_api_error(provider_id, response.status_code, response.text)
+        
+        return self._parse_response(provider_id, model, _loads(response.content))
+        
+    async def agenerate(
+        self,
+        prompt: str,
+        max_tokens: int = 4000,
+        temperature: float = 1.0,
+        model: Optional[str] = None,
+        use_fallback: bool = True
+    ) -> GenerationResult:
+        """Async version of generate()"""
+        
+        if not self.active_provider:
+            raise ValueError("No active provider. Call set_active_provider() first.")
+        
+        cache_entry, cached = await self._acache_lookup(prompt, max_tokens, temperature, model)
+        if cached is not None:
+            return cached
+        
+        start_time = time.time()
+        provider_ids = [self.active_provider['id']]
+        if use_fallback:
+            provider_ids += [p for p in self.fallback_chain if p != provider_ids[0]]
+        
+        last_error = None
+        for i, provider_id in enumerate(provider_ids):
+            if i > 0 and self._rate_limited(provider_id):
+                print(f"→ Skipping {self.providers[provider_id].name} (rate limited)")
+                continue
+            
+            try:
+                result = await self._agenerate_with_provider(
+                    provider_id,
+                    prompt,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    model=model
+                )
+            except Exception as error:
+                print(f"Error with {self.providers[provider_id].name}: {error}")
+                last_error = error
+                continue
+            
+            result.response_time = time.time() - start_time
+            result.used_fallback = i > 0
+            self._track_usage(provider_id, result)
+            self._cache_store(cache_entry, provider_id, result)
+            return result
+        
+        raise Exception(f"All providers failed. Last error: {last_error}")
+        
+    async def agenerate_batch(self, prompts: List[str], **kwargs) -> List[GenerationResult]:
+        """Generate responses for many prompts concurrently on the event loop"""
+        return await asyncio.gather(*[self.agenerate(p, **kwargs) for p in prompts])
+        
+    async def aclose(self):
+        """Release the running event loop's async client connections"""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+        
+    async def __aenter__(self) -> "AIProviderEngine":
+        return self
+        
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+        
     def _track_usage(self, provider_id: str, result: GenerationResult):
         """Track usage statistics"""
-        stats = self.costs[provider_id]
-        
-        stats['total_requests'] += 1
-        stats['total_tokens'] += result.usage.get('total_tokens', 0)
-        stats['total_cost'] += result.cost
-        
-        # Update average response time
-        n = stats['total_requests']
-        prev_avg = stats['avg_response_time']
-        stats['avg_response_time'] = (prev_avg * (n - 1) + result.response_time) / n
-        
-        # Store in history (keep last 100)
-        self.request_history.append({
-            'timestamp': time.time(),
-            'provider': provider_id,
-            'model': result.model,
-            'tokens': result.usage.get('total_tokens', 0),
-            'cost': result.cost,
-            'response_time': result.response_time
-        })
-        
-        if len(self.request_history) > 100:
-            self.request_history.pop(0)
+        with self._stats_lock:
+            stats = self.costs[provider_id]
+            
+            stats['total_requests'] += 1
+            stats['total_tokens'] += result.usage.get('total_tokens', 0)
+            stats['total_cost'] += result.cost
+            
+            # Update average response time
+            n = stats['total_requests']
+            prev_avg = stats['avg_response_time']
+            stats['avg_response_time'] = (prev_avg * (n - 1) + result.response_time) / n
+            self._stats_snapshot = None
+            
+            # Store in history (deque drops the oldest beyond 100)
+            self.request_history.append({
+                'timestamp': time.time(),
+                'provider': provider_id,
+                'model': result.model,
+                'tokens': result.usage.get('total_tokens', 0),
+                'cost': result.cost,
+                'response_time': result.response_time
+            })
             
     def get_stats(self, provider_id: Optional[str] = None) -> Dict:
-        """Get usage statistics"""
+        """Get usage statistics (the returned dict is shared; treat it as read-only)"""
         if provider_id:
             return self.costs.get(provider_id, {})
         
-        # Return all stats with provider names
-        all_stats = {}
-        for pid, stats in self.costs.items():
-            all_stats[pid] = {
-                **stats,
-                'name': self.providers[pid].name
-            }
-        return all_stats
+        # Return all stats with provider names, rebuilt only after new usage
+        with self._stats_lock:
+            if self._stats_snapshot is None:
+                self._stats_snapshot = {
+                    pid: {**stats, 'name': self.providers[pid].name}
+                    for pid, stats in self.costs.items()
+                }
+            return self._stats_snapshot
+        
+    def close(self):
+        """Release pooled HTTP connections"""
+        self._session.close()
+        self._probe_session.close()
         
     def export_config(self) -> Dict:
         """Export configuration (without API keys)"""
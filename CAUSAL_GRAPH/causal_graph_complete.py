@@ -12,10 +12,99 @@ All four work together to create a complete consciousness physics engine.
 
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Any, Callable
-from dataclasses import dataclass, field
-from enum import Enum
-import networkx as nx
-from collections import deque
+from dataclasses import dataclass, field, InitVar
+from enum import Enum, IntEnum
+from collections import defaultdict, deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import array
+import io
+import os
+import sys
+import threading
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+
+# Shared worker pool for executing independent DAG nodes concurrently.
+# Created lazily so importing this module never spawns threads.
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+_MISS = object()
+
+# Inputs keyed by (type, value); np.generic covers NumPy scalars
+_SCALAR_TYPES = (type(None), bool, int, float, complex, str, bytes, np.generic)
+
+
+class _ArrayKey:
+    """
+    Memo key for an ndarray input.
+    
+    Hashes the contents once (xxhash when installed) but compares dtype,
+    shape and the full bytes on lookup, so a hash collision can never
+    return another input's result.
+    """
+    
+    __slots__ = ('dtype', 'shape', 'raw', '_hash')
+    
+    def __init__(self, value: np.ndarray):
+        self.dtype = value.dtype.str
+        self.shape = value.shape
+        self.raw = value.tobytes()
+        digest = xxhash.xxh64_intdigest(self.raw) if XXHASH_AVAILABLE else hash(self.raw)
+        self._hash = hash((self.dtype, self.shape, digest))
+    
+    def __hash__(self) -> int:
+        return self._hash
+    
+    def __eq__(self, other: Any) -> bool:
+        return (
+            isinstance(other, _ArrayKey)
+            and self.dtype == other.dtype
+            and self.shape == other.shape
+            and self.raw == other.raw
+        )
+
+
+def _memo_key(value: Any) -> Any:
+    """
+    Exact-match memo key for a node input, or _MISS if it has none.
+    
+    Scalars key on (type, value), tuples element-wise and ndarrays on
+    dtype, shape and contents. Dicts, lists and other objects are not
+    keyed, so nodes receiving them always recompute.
+    """
+    if isinstance(value, np.ndarray):
+        return _MISS if value.dtype.hasobject else _ArrayKey(value)
+    
+    if isinstance(value, _SCALAR_TYPES):
+        return (type(value), value)
+    
+    if isinstance(value, tuple):
+        parts = []
+        for item in value:
+            key = _memo_key(item)
+            if key is _MISS:
+                return _MISS
+            parts.append(key)
+        return (tuple, tuple(parts))
+    
+    return _MISS
+
+# Assumed per-core L2 size used to size pipeline batches
+_L2_CACHE_BYTES = 1 << 20
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the module-level worker pool, creating it on first use"""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _EXECUTOR
 
 
 # ============================================================================
@@ -36,7 +125,7 @@ class NodeType(Enum):
     MEMORY = 'memory'           # Learning
 
 
-@dataclass
+@dataclass(slots=True)
 class GraphNode:
     """
     Node in the causal DAG.
@@ -50,6 +139,8 @@ class GraphNode:
     data: Any = None
     dependencies: List[str] = field(default_factory=list)
     metadata: Dict = field(default_factory=dict)
+    pure: bool = False  # Opt in: output depends only on inputs (safe to memoize)
+    positional: bool = False  # compute_fn takes dep outputs as positional args
     
     def execute(self, input_data: Dict) -> Any:
         """
@@ -64,7 +155,27 @@ class GraphNode:
         if self.compute_fn is None:
             return self.data
         
+        if self.positional:
+            return self.compute_fn(*[input_data[dep] for dep in dict.fromkeys(self.dependencies)])
+        
         return self.compute_fn(input_data)
+    
+    def positional_fn(self, dependencies: Tuple[str, ...]) -> Callable:
+        """
+        Return a callable taking dependency outputs as positional args.
+        
+        Legacy dict-style compute_fns are wrapped so they still receive
+        a dict keyed by dependency node_id.
+        """
+        if self.compute_fn is None:
+            return lambda *dep_values, _data=self.data: _data
+        
+        if self.positional:
+            return self.compute_fn
+        
+        return lambda *dep_values, _fn=self.compute_fn, _keys=dependencies: (
+            _fn(dict(zip(_keys, dep_values)))
+        )
 
 
 class CausalDAG:
@@ -77,18 +188,88 @@ class CausalDAG:
     - Parallel execution where possible
     """
     
-    def __init__(self):
-        self.graph = nx.DiGraph()
+    def __init__(self, memo_size: int = 4096):
         self.nodes: Dict[str, GraphNode] = {}
+        
+        # Outputs of pure nodes keyed by (node idx, dependency memo keys),
+        # evicted least-recently-used beyond memo_size entries
+        self.memo_size = memo_size
+        self._memo: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._memo_lock = threading.Lock()
+        
+        # Adjacency list (node -> successors) and in-degree counts
+        self._succ: Dict[str, List[str]] = {}
+        self._indeg: Dict[str, int] = {}
+        
+        # Cached topological order and per-node dependency tuples.
+        # The order is invalidated whenever the graph changes.
+        self._order: Optional[List[str]] = None
+        self._layers: Optional[List[List[str]]] = None
+        self._dep_cache: Dict[str, Tuple[str, ...]] = {}
+        
+        # Struct-of-arrays form is built by compile() and rebuilt after
+        # add_node(); freeze() locks it in
+        self._compiled = False
+        self._frozen = False
     
     def add_node(self, node: GraphNode):
         """Add node to graph"""
-        self.nodes[node.node_id] = node
-        self.graph.add_node(node.node_id, data=node)
+        if self._frozen:
+            raise RuntimeError("Cannot add nodes to a frozen CausalDAG")
+        
+        node_id = node.node_id
+        
+        # Re-adding a node replaces its incoming edges
+        for dep_id in self._dep_cache.get(node_id, ()):
+            self._succ[dep_id].remove(node_id)
         
-        # Add edges from dependencies
-        for dep_id in node.dependencies:
-            self.graph.add_edge(dep_id, node.node_id)
+        self.nodes[node_id] = node
+        self._succ.setdefault(node_id, [])
+        self._indeg[node_id] = 0
+        self._order = None
+        self._layers = None
+        self._compiled = False
+        self._memo.clear()
+        
+        # Add edges from dependencies (duplicates collapse to one edge)
+        deps = tuple(dict.fromkeys(node.dependencies))
+        self._dep_cache[node_id] = deps
+        for dep_id in deps:
+            self._succ.setdefault(dep_id, []).append(node_id)
+            self._indeg.setdefault(dep_id, 0)
+            self._indeg[node_id] += 1
+    
+    def _generations(self) -> List[List[str]]:
+        """
+        Kahn's algorithm, grouped by level.
+        
+        Each generation holds nodes whose dependencies all lie in
+        earlier generations.
+        """
+        if self._layers is not None:
+            return self._layers
+        
+        indeg = dict(self._indeg)
+        layer = [n for n, d in indeg.items() if d == 0]
+        layers = []
+        seen = 0
+        
+        while layer:
+            layers.append(layer)
+            seen += len(layer)
+            next_layer = []
+            for node_id in layer:
+                for succ in self._succ[node_id]:
+                    indeg[succ] -= 1
+                    if indeg[succ] == 0:
+                        next_layer.append(succ)
+            layer = next_layer
+        
+        if seen != len(indeg):
+            raise ValueError("Graph has cycles!")
+        
+        self._layers = layers
+        return layers
     
     def get_execution_order(self) -> List[str]:
         """
@@ -96,58 +277,308 @@ class CausalDAG:
         
         This is the order nodes must be executed to respect causality.
         """
-        try:
-            return list(nx.topological_sort(self.graph))
-        except nx.NetworkXError as e:
-            raise ValueError(f"Graph has cycles! {e}")
+        if self._order is None:
+            indeg = dict(self._indeg)
+            queue = deque(n for n, d in indeg.items() if d == 0)
+            order = []
+            
+            while queue:
+                node_id = queue.popleft()
+                order.append(node_id)
+                for succ in self._succ[node_id]:
+                    indeg[succ] -= 1
+                    if indeg[succ] == 0:
+                        queue.append(succ)
+            
+            if len(order) != len(indeg):
+                raise ValueError("Graph has cycles!")
+            
+            self._order = order
+        
+        return list(self._order)
+    
+    def freeze(self):
+        """
+        Validate and precompute everything needed for execution, once.
+        
+        Runs cycle detection and topological sorting, builds the
+        struct-of-arrays form and the generated executor (compile()), and
+        forbids further add_node() calls. Freezing is always explicit;
+        execute() only compiles.
+        
+        Raises:
+            ValueError: if the graph has cycles
+        """
+        if self._frozen:
+            return
+        
+        self.get_execution_order()
+        if not self._compiled:
+            self.compile()
+        self._frozen = True
     
-    def execute(self, initial_data: Dict) -> Dict:
+    def compile(self):
+        """
+        Flatten the graph into struct-of-arrays form for repeated execution.
+        
+        Every node_id gets an integer index. Dependencies are stored
+        CSR-style: the deps of node ``i`` are
+        ``_dep_idx[_dep_off[i]:_dep_off[i + 1]]``. String ids are only
+        used at the execute() boundary.
+        
+        compute_fns are snapshotted here; changing a node's compute_fn
+        afterwards requires re-adding the node.
+        """
+        layers = self._generations()
+        idx_to_id = list(self._indeg)
+        id_to_idx = {node_id: i for i, node_id in enumerate(idx_to_id)}
+        
+        nodes: List[Optional[GraphNode]] = []
+        compute_fns: List[Optional[Callable]] = []
+        pure: List[bool] = []
+        dep_names: List[Tuple[str, ...]] = []
+        dep_slices: List[Tuple[int, ...]] = []
+        dep_idx: List[int] = []
+        dep_off = [0]
+        for node_id in idx_to_id:
+            node = self.nodes.get(node_id)
+            deps = self._dep_cache.get(node_id, ())
+            nodes.append(node)
+            compute_fns.append(node.positional_fn(deps) if node is not None else None)
+            pure.append(node is not None and node.pure and node.compute_fn is not None)
+            dep_names.append(deps)
+            dep_slices.append(tuple(id_to_idx[dep] for dep in deps))
+            dep_idx.extend(dep_slices[-1])
+            dep_off.append(len(dep_idx))
+        
+        order_idx: List[int] = []
+        layer_off = [0]
+        for layer in layers:
+            order_idx.extend(id_to_idx[node_id] for node_id in layer)
+            layer_off.append(len(order_idx))
+        
+        self._idx_to_id = idx_to_id
+        self._id_to_idx = id_to_idx
+        self._nodes_by_idx = nodes
+        self._compute_fns = compute_fns
+        self._pure = pure
+        self._dep_names = dep_names
+        self._dep_slices = dep_slices
+        self._dep_idx = np.asarray(dep_idx, dtype=np.int32)
+        self._dep_off = np.asarray(dep_off, dtype=np.int32)
+        self._order_idx = np.asarray(order_idx, dtype=np.int32)
+        self._layer_off = np.asarray(layer_off, dtype=np.int32)
+        self._order_list = order_idx
+        self._layer_work = [
+            order_idx[layer_off[k]:layer_off[k + 1]] for k in range(len(layers))
+        ]
+        
+        # Reusable per-execute buffers
+        self._scratch: List[Any] = [None] * len(idx_to_id)
+        self._done: List[bool] = [False] * len(idx_to_id)
+        
+        self._compiled_run = self._generate_run()
+        self._compiled = True
+    
+    def _generate_run(self) -> Callable:
+        """
+        Code-generate a straight-line executor for the compiled graph.
+        
+        The generated function makes exactly one call per node, in
+        topological order, passing dependency outputs through local
+        variables instead of interpreting the dependency lists.
+        """
+        lines = ["def _run(values, done, fns, call):"]
+        
+        for i in self._order_list:
+            args = ", ".join(f"v{j}" for j in self._dep_slices[i])
+            if self._compute_fns[i] is None or self._pure[i]:
+                expr = f"call({i}, [{args}])"
+            else:
+                expr = f"fns[{i}]({args})"
+            lines.append(f"    v{i} = values[{i}] if done[{i}] else {expr}")
+        
+        outputs = ", ".join(f"v{i}" for i in range(len(self._idx_to_id)))
+        lines.append(f"    values[:] = [{outputs}]")
+        
+        namespace: Dict[str, Any] = {}
+        exec(compile("\n".join(lines), "<causal_dag>", "exec"), namespace)
+        return namespace["_run"]
+    
+    def _call(self, i: int, dep_values: List[Any]) -> Any:
+        """Run node ``i``, consulting the memo table for pure nodes"""
+        fn = self._compute_fns[i]
+        if fn is None:
+            raise KeyError(self._idx_to_id[i])
+        
+        if not self._pure[i]:
+            return fn(*dep_values)
+        
+        key = _memo_key(tuple(dep_values))
+        if key is _MISS:
+            return fn(*dep_values)
+        key = (i, key)
+        
+        # The memo and hit counters are shared by parallel=True workers;
+        # every read-modify-write happens under _memo_lock
+        with self._memo_lock:
+            result = self._memo.get(key, _MISS)
+            if result is not _MISS:
+                self._memo.move_to_end(key)
+                metadata = self._nodes_by_idx[i].metadata
+                metadata['memo_hits'] = metadata.get('memo_hits', 0) + 1
+                return result
+        
+        result = fn(*dep_values)
+        
+        with self._memo_lock:
+            self._memo[key] = result
+            self._memo.move_to_end(key)
+            if len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        
+        return result
+    
+    def execute(self, initial_data: Dict, parallel: bool = False) -> Dict:
         """
         Execute entire graph in causal order.
         
+        The graph is compiled on first use, and again after any
+        add_node() (see compile()), then run through a generated
+        straight-line function. Outputs of nodes marked
+        ``pure=True`` are memoized on their dependency outputs when those
+        are scalars, tuples or ndarrays (see _memo_key), so repeated
+        inputs skip recomputation; memoized outputs are shared between
+        calls and must not be mutated.
+        
+        With ``parallel=True`` each topological generation is instead
+        run on a shared thread pool. compute_fns must then be
+        thread-safe; the speedup is real only for compute_fns that
+        release the GIL (NumPy, I/O, ``numba.njit(nogil=True)``).
+        Memo lookups, evictions and ``memo_hits`` counts are locked.
+        
+        Intermediate values live in a scratch buffer owned by the DAG, so
+        a single CausalDAG must not be executed from several threads at
+        once.
+        
         Returns:
             Dict mapping node_ids to their computed outputs
         """
+        if not self._compiled:
+            self.compile()
+        
+        idx_to_id = self._idx_to_id
+        values = self._scratch
+        done = self._done
+        n = len(idx_to_id)
+        values[:] = [None] * n
+        done[:] = [False] * n
+        
+        # Seed from initial_data (string lookups only at this boundary)
         results = initial_data.copy()
-        execution_order = self.get_execution_order()
+        for node_id, value in initial_data.items():
+            i = self._id_to_idx.get(node_id)
+            if i is not None:
+                values[i] = value
+                done[i] = True
         
-        for node_id in execution_order:
-            if node_id in results:
-                continue  # Already have result (from initial_data)
+        if parallel:
+            dep_slices = self._dep_slices
             
-            node = self.nodes[node_id]
+            def run(i):
+                return i, self._call(i, [values[j] for j in dep_slices[i]])
             
-            # Gather dependencies
-            deps = {dep: results[dep] for dep in node.dependencies}
-            
-            # Execute node
-            result = node.execute(deps)
-            results[node_id] = result
+            for layer in self._layer_work:
+                # Skip nodes we already have results for (from initial_data)
+                work = [i for i in layer if not done[i]]
+                
+                if len(work) <= 1:
+                    computed = map(run, work)
+                else:
+                    computed = _get_executor().map(run, work)
+                
+                for i, result in computed:
+                    values[i] = result
+        else:
+            self._compiled_run(values, done, self._compute_fns, self._call)
+        
+        for i in self._order_list:
+            if not done[i]:
+                results[idx_to_id[i]] = values[i]
+        
+        return results
+    
+    def execute_subset(self, targets: List[str], initial_data: Dict) -> Dict:
+        """
+        Execute only the nodes needed to produce ``targets``.
+        
+        Dependencies are walked backward from the targets (stopping at
+        anything supplied in initial_data); every other branch of the
+        graph is skipped.
+        
+        Returns:
+            Dict mapping node_ids to their computed outputs
+        """
+        if not self._compiled:
+            self.compile()
+        
+        id_to_idx = self._id_to_idx
+        dep_slices = self._dep_slices
+        
+        # Backward BFS over predecessors
+        needed = set()
+        queue = deque(id_to_idx[node_id] for node_id in targets)
+        while queue:
+            i = queue.popleft()
+            if i in needed:
+                continue
+            needed.add(i)
+            if self._idx_to_id[i] not in initial_data:
+                queue.extend(dep_slices[i])
+        
+        values = self._scratch
+        values[:] = [None] * len(values)
+        
+        results = initial_data.copy()
+        for node_id, value in initial_data.items():
+            i = id_to_idx.get(node_id)
+            if i is not None:
+                values[i] = value
+        
+        for i in self._order_list:
+            if i not in needed:
+                continue
+            node_id = self._idx_to_id[i]
+            if node_id in initial_data:
+                continue
+            values[i] = self._call(i, [values[j] for j in dep_slices[i]])
+            results[node_id] = values[i]
         
         return results
     
     def visualize(self) -> str:
         """Generate ASCII visualization of graph"""
         # Simple layer-based visualization
-        layers = list(nx.topological_generations(self.graph))
+        layers = self._generations()
         
-        viz = "CAUSAL GRAPH STRUCTURE:\n\n"
+        buf = io.StringIO()
+        buf.write("CAUSAL GRAPH STRUCTURE:\n\n")
         
         for i, layer in enumerate(layers):
-            viz += f"Layer {i}:\n"
+            buf.write(f"Layer {i}:\n")
             for node_id in layer:
                 node = self.nodes[node_id]
-                viz += f"  [{node.node_type.value}] {node_id}\n"
-            viz += "\n"
+                buf.write(f"  [{node.node_type.value}] {node_id}\n")
+            buf.write("\n")
         
-        return viz
+        return buf.getvalue()
 
 
 # ============================================================================
 # ARCHITECTURE 2: COMPUTATION PIPELINE
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PipelineStage:
     """
     Single stage in the computation pipeline.
@@ -162,32 +593,47 @@ class PipelineStage:
     transform_fn: Callable
     validation_fn: Optional[Callable] = None
     rollback_fn: Optional[Callable] = None
+    nothrow: bool = False  # transform_fn returns (ok, output_or_reason)
+    _has_validation: bool = field(init=False, repr=False, default=False)
+    
+    def __post_init__(self):
+        self._has_validation = self.validation_fn is not None
+    
+    def _fail(self, data: Any, error: str) -> Tuple[bool, Any, Optional[str]]:
+        if self.rollback_fn:
+            self.rollback_fn(data)
+        return False, None, error
     
     def execute(self, data: Any) -> Tuple[bool, Any, Optional[str]]:
         """
         Execute pipeline stage.
         
+        Stages built with ``nothrow=True`` report expected failures by
+        returning ``(False, reason)`` from transform_fn instead of
+        raising; exceptions are still caught as programmer errors.
+        
         Returns:
             (success, output_data, error_message)
         """
         try:
             # Transform
-            output = self.transform_fn(data)
+            if self.nothrow:
+                ok, output = self.transform_fn(data)
+                if not ok:
+                    return self._fail(data, f"Transform failed: {output}")
+            else:
+                output = self.transform_fn(data)
             
             # Validate
-            if self.validation_fn:
+            if self._has_validation:
                 is_valid, reason = self.validation_fn(output)
                 if not is_valid:
-                    if self.rollback_fn:
-                        self.rollback_fn(data)
-                    return False, None, f"Validation failed: {reason}"
-            
-            return True, output, None
+                    return self._fail(data, f"Validation failed: {reason}")
             
         except Exception as e:
-            if self.rollback_fn:
-                self.rollback_fn(data)
-            return False, None, str(e)
+            return self._fail(data, str(e))
+        
+        return True, output, None
 
 
 class ComputationPipeline:
@@ -228,6 +674,59 @@ class ComputationPipeline:
         
         return True, data, error_log
     
+    def execute_batch(self, records: List[Any], workers: Optional[int] = None,
+                      batch_size: Optional[int] = None) -> List[Tuple[bool, Any, List[str]]]:
+        """
+        Execute the pipeline over many independent records.
+        
+        Records are processed in batches sized to stay L2-resident; each
+        stage runs across the whole batch on a thread pool before the
+        next stage starts. A record that fails drops out of later stages
+        without affecting its peers.
+        
+        Returns:
+            One (success, final_output, error_log) tuple per record
+        """
+        if not records:
+            return []
+        
+        if batch_size is None:
+            sample = records[:16]
+            avg_bytes = sum(sys.getsizeof(r) for r in sample) / len(sample)
+            batch_size = min(64, len(records), max(1, int(_L2_CACHE_BYTES // max(avg_bytes, 1))))
+        
+        outcomes: List[Tuple[bool, Any, List[str]]] = []
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for start in range(0, len(records), batch_size):
+                data = list(records[start:start + batch_size])
+                error_logs: List[List[str]] = [[] for _ in data]
+                alive = list(range(len(data)))
+                
+                for i, stage in enumerate(self.stages):
+                    if not alive:
+                        break
+                    
+                    stage_results = pool.map(stage.execute, [data[j] for j in alive])
+                    still_alive = []
+                    
+                    for j, (success, output, error) in zip(alive, stage_results):
+                        if success:
+                            data[j] = output
+                            still_alive.append(j)
+                        else:
+                            error_logs[j].append(f"Stage {i} ({stage.stage_name}): {error}")
+                    
+                    alive = still_alive
+                
+                for j in range(len(data)):
+                    if error_logs[j]:
+                        outcomes.append((False, None, error_logs[j]))
+                    else:
+                        outcomes.append((True, data[j], error_logs[j]))
+        
+        return outcomes
+    
     def get_stage_names(self) -> List[str]:
         """Get names of all pipeline stages"""
         return [stage.stage_name for stage in self.stages]
@@ -237,24 +736,42 @@ class ComputationPipeline:
 # ARCHITECTURE 3: STATE MACHINE
 # ============================================================================
 
-class ComputationState(Enum):
+class ComputationState(IntEnum):
     """States in the consciousness computation"""
-    INITIALIZED = 'initialized'
-    SUBSTRATE_LOADED = 'substrate_loaded'
-    ARCHETYPAL_RESOLVED = 'archetypal_resolved'
-    BIOLOGICAL_ANCHORED = 'biological_anchored'
-    DIMENSIONAL_PROJECTED = 'dimensional_projected'
-    TEMPORAL_ACTIVATED = 'temporal_activated'
-    RESONANCE_CALCULATED = 'resonance_calculated'
-    COLLAPSE_READY = 'collapse_ready'
-    COLLAPSED = 'collapsed'
-    EXPRESSED = 'expressed'
-    MEMORY_UPDATED = 'memory_updated'
-    COMPLETED = 'completed'
-    FAILED = 'failed'
-
-
-@dataclass
+    INITIALIZED = 0
+    SUBSTRATE_LOADED = 1
+    ARCHETYPAL_RESOLVED = 2
+    BIOLOGICAL_ANCHORED = 3
+    DIMENSIONAL_PROJECTED = 4
+    TEMPORAL_ACTIVATED = 5
+    RESONANCE_CALCULATED = 6
+    COLLAPSE_READY = 7
+    COLLAPSED = 8
+    EXPRESSED = 9
+    MEMORY_UPDATED = 10
+    COMPLETED = 11
+    FAILED = 12
+
+
+# Display names for ComputationState
+_NAMES: Dict[ComputationState, str] = {
+    ComputationState.INITIALIZED: 'initialized',
+    ComputationState.SUBSTRATE_LOADED: 'substrate_loaded',
+    ComputationState.ARCHETYPAL_RESOLVED: 'archetypal_resolved',
+    ComputationState.BIOLOGICAL_ANCHORED: 'biological_anchored',
+    ComputationState.DIMENSIONAL_PROJECTED: 'dimensional_projected',
+    ComputationState.TEMPORAL_ACTIVATED: 'temporal_activated',
+    ComputationState.RESONANCE_CALCULATED: 'resonance_calculated',
+    ComputationState.COLLAPSE_READY: 'collapse_ready',
+    ComputationState.COLLAPSED: 'collapsed',
+    ComputationState.EXPRESSED: 'expressed',
+    ComputationState.MEMORY_UPDATED: 'memory_updated',
+    ComputationState.COMPLETED: 'completed',
+    ComputationState.FAILED: 'failed',
+}
+
+
+@dataclass(slots=True)
 class StateTransition:
     """
     Transition between computation states.
@@ -283,101 +800,185 @@ class StateMachine:
     Ensures:
     - Valid state transitions only
     - Rollback capability
-    - State history tracking
+    - State history tracking (last history_limit states)
     """
     
-    def __init__(self, initial_state: ComputationState):
+    # History is stored as one-byte ComputationState values
+    _ord_to_state: List[ComputationState] = list(ComputationState)
+    
+    def __init__(self, initial_state: ComputationState, history_limit: int = 1024):
         self.current_state = initial_state
-        self.transitions: Dict[ComputationState, List[StateTransition]] = {}
-        self.state_history: List[ComputationState] = [initial_state]
+        self._by_pair: Dict[Tuple[ComputationState, ComputationState], StateTransition] = {}
+        if history_limit < 1:
+            raise ValueError("history_limit must be at least 1")
+        self.history_limit = history_limit
+        
+        # Ring buffer: _hist_len states starting at _hist_head, wrapping
+        self._hist_ord = array.array('B', bytes(history_limit))
+        self._hist_ord[0] = initial_state
+        self._hist_head = 0
+        self._hist_len = 1
         self.context: Dict = {}
     
+    @property
+    def state_history(self) -> List[ComputationState]:
+        """Recorded states, oldest first"""
+        ord_to_state = self._ord_to_state
+        buf, head, limit = self._hist_ord, self._hist_head, self.history_limit
+        return [ord_to_state[buf[(head + i) % limit]] for i in range(self._hist_len)]
+    
+    @property
+    def transitions(self) -> Dict[ComputationState, List[StateTransition]]:
+        """Registered transitions grouped by source state (read-only view)"""
+        grouped: Dict[ComputationState, List[StateTransition]] = defaultdict(list)
+        for (from_state, _), trans in self._by_pair.items():
+            grouped[from_state].append(trans)
+        return grouped
+    
     def add_transition(self, transition: StateTransition):
         """Register state transition"""
-        if transition.from_state not in self.transitions:
-            self.transitions[transition.from_state] = []
+        pair = (transition.from_state, transition.to_state)
+        if pair in self._by_pair:
+            raise ValueError(
+                f"Transition from {_NAMES[transition.from_state]} "
+                f"to {_NAMES[transition.to_state]} already registered"
+            )
         
-        self.transitions[transition.from_state].append(transition)
+        self._by_pair[pair] = transition
     
-    def transition_to(self, target_state: ComputationState) -> Tuple[bool, str]:
+    def transition_to(self, target_state: ComputationState) -> Tuple[bool, Optional[str]]:
         """
         Attempt to transition to target state.
         
         Returns:
-            (success, message)
+            (success, message) - message is None on success
         """
         # Find valid transition
-        available = self.transitions.get(self.current_state, [])
+        trans = self._by_pair.get((self.current_state, target_state))
         
-        for trans in available:
-            if trans.to_state == target_state:
-                # Check if transition allowed
-                can_transition, reason = trans.can_transition(self.context)
-                
-                if not can_transition:
-                    return False, f"Transition blocked: {reason}"
-                
-                # Execute transition
-                self.context = trans.execute(self.context)
-                
-                # Update state
-                self.current_state = target_state
-                self.state_history.append(target_state)
-                
-                return True, f"Transitioned to {target_state.value}"
+        if trans is None:
+            return False, f"No transition from {_NAMES[self.current_state]} to {_NAMES[target_state]}"
+        
+        # Check if transition allowed
+        can_transition, reason = trans.can_transition(self.context)
+        
+        if not can_transition:
+            return False, f"Transition blocked: {reason}"
+        
+        # Execute transition
+        self.context = trans.execute(self.context)
         
-        return False, f"No transition from {self.current_state.value} to {target_state.value}"
+        # Update state
+        self.current_state = target_state
+        limit = self.history_limit
+        self._hist_ord[(self._hist_head + self._hist_len) % limit] = target_state
+        if self._hist_len < limit:
+            self._hist_len += 1
+        else:
+            # Full: the write replaced the oldest state
+            self._hist_head = (self._hist_head + 1) % limit
+        
+        return True, None
     
     def rollback(self, steps: int = 1):
         """Rollback to previous state"""
-        if len(self.state_history) <= steps:
+        if self._hist_len <= steps:
             raise ValueError("Cannot rollback beyond initial state")
         
         # Remove recent states
-        for _ in range(steps):
-            self.state_history.pop()
+        if steps > 0:
+            self._hist_len -= steps
         
         # Restore previous state
-        self.current_state = self.state_history[-1]
+        newest = (self._hist_head + self._hist_len - 1) % self.history_limit
+        self.current_state = self._ord_to_state[self._hist_ord[newest]]
 
 
 # ============================================================================
 # ARCHITECTURE 4: NEURAL-LIKE FORWARD/BACKWARD PASSES
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Layer:
     """
     Layer in neural-like architecture.
     
     Has both forward (collapse) and backward (learning) functions.
+    
+    forward_fn and backward_fn receive the parameters as a name → value
+    dict, as before packing. With ``packed=True`` they receive the
+    float32 parameter array instead (indexed via _param_names), and
+    backward_fn may return an update array rather than a dict.
     """
     
     layer_name: str
-    forward_fn: Callable    # Data → Output
-    backward_fn: Callable   # Gradient → Update
-    parameters: Dict = field(default_factory=dict)
+    forward_fn: Callable    # (Data, params) → Output
+    backward_fn: Optional[Callable] = None  # (Gradient, params) → updates
+    parameters: InitVar[Optional[Dict]] = None  # Initial name → value
+    lr: float = 1.0
+    packed: bool = False  # fns take the params array instead of a dict
+    _params: np.ndarray = field(init=False, repr=False)
+    _param_names: Dict[str, int] = field(init=False, repr=False)
+    _grad_mask: np.ndarray = field(init=False, repr=False)
+    
+    def __post_init__(self, parameters: Optional[Dict]):
+        # Parameters are packed into one float32 array so updates are a
+        # single vectorized add; _param_names maps name → index
+        parameters = parameters or {}
+        self._param_names = {name: i for i, name in enumerate(parameters)}
+        self._params = np.array(list(parameters.values()), dtype=np.float32)
+        
+        # Which parameters a scalar gravity gradient adjusts (all, by default)
+        self._grad_mask = np.ones_like(self._params)
+    
+    def get_parameters(self) -> Dict[str, float]:
+        """Current parameter values by name"""
+        return {name: float(self._params[i]) for name, i in self._param_names.items()}
     
     def forward(self, input_data: Any) -> Any:
         """Forward pass (collapse computation)"""
-        return self.forward_fn(input_data, self.parameters)
+        params = self._params if self.packed else self.get_parameters()
+        return self.forward_fn(input_data, params)
     
     def backward(self, gradient: Any) -> Any:
         """
         Backward pass (Bayesian learning).
         
         LAW VIII: Memory deepening
+        
+        Without a backward_fn the gradient is a scalar gravity adjustment
+        applied to every masked parameter in one fused update.
         """
-        param_updates = self.backward_fn(gradient, self.parameters)
+        if self.backward_fn is None:
+            self._params += np.float32(gradient * self.lr) * self._grad_mask
+            return gradient
+        
+        params = self._params if self.packed else self.get_parameters()
+        updates = self.backward_fn(gradient, params)
+        
+        # Dict-style backward_fns return a dict of per-name updates
+        if isinstance(updates, dict):
+            packed = np.zeros_like(self._params)
+            for key, update in updates.items():
+                if key in self._param_names:
+                    packed[self._param_names[key]] = update
+            updates = packed
         
-        # Update parameters
-        for key, update in param_updates.items():
-            if key in self.parameters:
-                self.parameters[key] += update
+        # Update parameters in place
+        if self.lr != 1.0:
+            updates = np.multiply(updates, self.lr, dtype=np.float32)
+        np.add(self._params, updates, out=self._params, casting='unsafe')
         
         return gradient  # Pass gradient backward
 
 
+# Read-only name → value copy. Attached after @dataclass so that the
+# ``parameters`` constructor argument (an InitVar) keeps its None default.
+Layer.parameters = property(
+    Layer.get_parameters, doc="Current parameter values by name (read-only copy)"
+)
+
+
 class NeuralLikeArchitecture:
     """
     Neural network-style architecture for consciousness computation.
@@ -386,8 +987,9 @@ class NeuralLikeArchitecture:
     Backward pass: Memory deepening (resonance → gravity update)
     """
     
-    def __init__(self):
+    def __init__(self, lr: float = 0.2):
         self.layers: List[Layer] = []
+        self.lr = lr
     
     def add_layer(self, layer: Layer):
         """Add computational layer"""
@@ -415,24 +1017,14 @@ class NeuralLikeArchitecture:
         
         Updates attractor gravity based on feedback.
         """
-        # Convert feedback to gradient
-        gradient = self._feedback_to_gradient(resonance_feedback)
+        # Positive resonance → strengthen
+        # Negative resonance → weaken
+        resonance = resonance_feedback.get('resonance_score', 0.5)
+        gradient = np.float32((resonance - 0.5) * self.lr)
         
         # Backpropagate through layers (reverse order)
         for layer in reversed(self.layers):
             gradient = layer.backward(gradient)
-    
-    def _feedback_to_gradient(self, feedback: Dict) -> Dict:
-        """Convert resonance feedback to learning gradient"""
-        resonance = feedback.get('resonance_score', 0.5)
-        
-        # Positive resonance → strengthen
-        # Negative resonance → weaken
-        gradient = {
-            'gravity_adjustment': (resonance - 0.5) * 0.2  # Learning rate = 0.2
-        }
-        
-        return gradient
 
 
 # ============================================================================
@@ -478,21 +1070,24 @@ class UnifiedCausalGraph:
             node_id='substrate_base',
             node_type=NodeType.SUBSTRATE,
             dependencies=['source_stellar'],
-            compute_fn=lambda d: self._compute_base(d['source_stellar'])
+            compute_fn=self._compute_base,
+            positional=True
         ))
         
         self.dag.add_node(GraphNode(
             node_id='substrate_tone',
             node_type=NodeType.SUBSTRATE,
             dependencies=['substrate_base'],
-            compute_fn=lambda d: self._compute_tone(d['substrate_base'])
+            compute_fn=self._compute_tone,
+            positional=True
         ))
         
         self.dag.add_node(GraphNode(
             node_id='substrate_color',
             node_type=NodeType.SUBSTRATE,
             dependencies=['substrate_tone'],
-            compute_fn=lambda d: self._compute_color(d['substrate_tone'])
+            compute_fn=self._compute_color,
+            positional=True
         ))
         
         # Archetypal layer
@@ -500,14 +1095,16 @@ class UnifiedCausalGraph:
             node_id='archetypal_gate',
             node_type=NodeType.ARCHETYPAL,
             dependencies=['substrate_color'],
-            compute_fn=lambda d: self._compute_gate(d['substrate_color'])
+            compute_fn=self._compute_gate,
+            positional=True
         ))
         
         self.dag.add_node(GraphNode(
             node_id='archetypal_line',
             node_type=NodeType.ARCHETYPAL,
             dependencies=['archetypal_gate'],
-            compute_fn=lambda d: self._compute_line(d['archetypal_gate'])
+            compute_fn=self._compute_line,
+            positional=True
         ))
         
         # Biological layer
@@ -515,7 +1112,8 @@ class UnifiedCausalGraph:
             node_id='biological_center',
             node_type=NodeType.BIOLOGICAL,
             dependencies=['archetypal_line'],
-            compute_fn=lambda d: self._compute_center(d['archetypal_line'])
+            compute_fn=self._compute_center,
+            positional=True
         ))
         
         # Dimensional layer
@@ -523,10 +1121,8 @@ class UnifiedCausalGraph:
             node_id='dimensional_operator',
             node_type=NodeType.DIMENSIONAL,
             dependencies=['substrate_base', 'biological_center'],
-            compute_fn=lambda d: self._compute_dimension(
-                d['substrate_base'],
-                d['biological_center']
-            )
+            compute_fn=self._compute_dimension,
+            positional=True
         ))
         
         # Temporal layer
@@ -534,7 +1130,8 @@ class UnifiedCausalGraph:
             node_id='temporal_planet',
             node_type=NodeType.TEMPORAL,
             dependencies=['source_stellar'],
-            compute_fn=lambda d: self._compute_planet(d['source_stellar'])
+            compute_fn=self._compute_planet,
+            positional=True
         ))
         
         # Resonance layer
@@ -546,7 +1143,8 @@ class UnifiedCausalGraph:
                 'archetypal_line',
                 'substrate_color'
             ],
-            compute_fn=lambda d: self._compute_resonance(d)
+            compute_fn=self._compute_resonance,
+            positional=True
         ))
         
         # Collapse layer
@@ -558,7 +1156,8 @@ class UnifiedCausalGraph:
                 'temporal_planet',
                 'substrate_base'
             ],
-            compute_fn=lambda d: self._compute_collapse(d)
+            compute_fn=self._compute_collapse,
+            positional=True
         ))
         
         # Expression layer
@@ -566,7 +1165,8 @@ class UnifiedCausalGraph:
             node_id='expression_sentence',
             node_type=NodeType.EXPRESSION,
             dependencies=['collapse_event'],
-            compute_fn=lambda d: self._generate_sentence(d['collapse_event'])
+            compute_fn=self._generate_sentence,
+            positional=True
         ))
         
         # Memory layer
@@ -574,9 +1174,15 @@ class UnifiedCausalGraph:
             node_id='memory_update',
             node_type=NodeType.MEMORY,
             dependencies=['expression_sentence', 'resonance_field'],
-            compute_fn=lambda d: self._update_memory(d)
+            compute_fn=self._update_memory,
+            positional=True,
+            pure=False  # Side effect: writes memory
         ))
         
+        # Detect cycles and precompute execution now, not on first execute.
+        # Not frozen: callers may still extend the standard graph.
+        self.dag.compile()
+        
         # === PIPELINE STAGES ===
         
         self.pipeline.add_stage(PipelineStage(
@@ -618,17 +1224,21 @@ class UnifiedCausalGraph:
         self.neural.add_layer(Layer(
             layer_name='substrate_layer',
             forward_fn=self._forward_substrate,
-            backward_fn=self._backward_substrate
+            backward_fn=self._backward_substrate,
+            packed=True
         ))
         
         self.neural.add_layer(Layer(
             layer_name='collapse_layer',
             forward_fn=self._forward_collapse,
-            backward_fn=self._backward_collapse
+            backward_fn=self._backward_collapse,
+            packed=True
         ))
     
     # === PLACEHOLDER COMPUTE FUNCTIONS ===
-    # These would be replaced with actual implementations
+    # These would be replaced with actual implementations.
+    # Each receives its dependency outputs positionally, in the order
+    # listed in the node's dependencies.
     
     def _compute_base(self, stellar): return {'base': 3}
     def _compute_tone(self, base): return {'tone': 4}
@@ -638,10 +1248,10 @@ class UnifiedCausalGraph:
     def _compute_center(self, line): return {'center': 'G'}
     def _compute_dimension(self, base, center): return {'dimension': 'Being'}
     def _compute_planet(self, stellar): return {'planet': 'Mars'}
-    def _compute_resonance(self, deps): return {'resonance': 0.8}
-    def _compute_collapse(self, deps): return {'collapsed': True}
+    def _compute_resonance(self, dimension, line, color): return {'resonance': 0.8}
+    def _compute_collapse(self, resonance, planet, base): return {'collapsed': True}
     def _generate_sentence(self, collapse): return "I Am survival"
-    def _update_memory(self, deps): return {'memory': 'updated'}
+    def _update_memory(self, sentence, resonance): return {'memory': 'updated'}
     
     def _extract_substrate(self, d): return d
     def _resolve_archetypal(self, d): return d
@@ -654,8 +1264,8 @@ class UnifiedCausalGraph:
     
     def _forward_substrate(self, data, params): return data
     def _forward_collapse(self, data, params): return data
-    def _backward_substrate(self, grad, params): return {}
-    def _backward_collapse(self, grad, params): return {}
+    def _backward_substrate(self, grad, params): return np.zeros_like(params)
+    def _backward_collapse(self, grad, params): return np.zeros_like(params)
 
 
 # ============================================================================
@@ -683,10 +1293,10 @@ if __name__ == "__main__":
     
     # State Machine
     print("\n=== STATE MACHINE ===")
-    print(f"Current state: {graph.state_machine.current_state.value}")
+    print(f"Current state: {_NAMES[graph.state_machine.current_state]}")
     
     success, msg = graph.state_machine.transition_to(ComputationState.SUBSTRATE_LOADED)
-    print(f"Transition result: {msg}")
+    print(f"Transition result: {msg if not success else _NAMES[graph.state_machine.current_state]}")
     
     # Neural-like learning
     print("\n=== NEURAL LEARNING ===")
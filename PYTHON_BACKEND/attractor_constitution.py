@@ -6,10 +6,33 @@ These are not metaphors. These are operating laws.
 Every attractor in the system obeys these rules.
 """
 
+import functools
+import math
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Callable
+from types import MappingProxyType
+from typing import Dict, List, Tuple, Optional, Callable, Union
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+# Fixed sampling grid for PolarityPair.interference_pattern (read-only).
+# sin(x + pi) == -sin(x), so both waves share one basis.
+_POLARITY_X = np.linspace(0, 2*np.pi, 100)
+_POLARITY_SIN = np.sin(_POLARITY_X)
+_POLARITY_SIN.setflags(write=False)
 
 
 # ============================================================================
@@ -17,7 +40,7 @@ from enum import Enum
 # "An attractor exists as a field, not as a definition."
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SemanticField:
     """
     An attractor is a probability distribution in semantic space,
@@ -31,6 +54,32 @@ class SemanticField:
     semantic_neighbors: List[str]  # Related concepts in the field
     field_radius: float  # How far the attractor's influence extends
     gravity_strength: float  # How strongly it pulls meaning (0-1)
+    _cdf: np.ndarray = field(init=False, repr=False, compare=False)
+    _cdf_source: bytes = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Cumulative distribution for context-free sampling
+        self._refresh_cdf()
+    
+    def _refresh_cdf(self) -> np.ndarray:
+        """
+        Return the cached CDF, rebuilding it if field_distribution changed.
+        
+        The distribution's bytes are the fingerprint, so both reassigning
+        field_distribution (e.g. after reloading persisted state) and
+        editing it in place are picked up on the next sample.
+        """
+        source = np.asarray(self.field_distribution).tobytes()
+        if getattr(self, '_cdf_source', None) != source:
+            self._cdf = self._build_cdf(self.field_distribution)
+            self._cdf_source = source
+        return self._cdf
+    
+    @staticmethod
+    def _build_cdf(distribution: np.ndarray) -> np.ndarray:
+        cdf = np.cumsum(distribution, dtype=np.float64)
+        cdf /= cdf[-1]
+        return cdf
     
     def sample_from_field(self, context: Dict = None) -> str:
         """
@@ -41,18 +90,15 @@ class SemanticField:
         """
         if context:
             # Context modulates the sampling distribution
-            modulated_dist = self._apply_context_modulation(
+            cdf = self._build_cdf(self._apply_context_modulation(
                 self.field_distribution,
                 context
-            )
+            ))
         else:
-            modulated_dist = self.field_distribution
+            cdf = self._refresh_cdf()
         
-        # Sample from the distribution
-        idx = np.random.choice(
-            len(self.semantic_neighbors),
-            p=modulated_dist / modulated_dist.sum()
-        )
+        # Inverse-CDF sample from the distribution
+        idx = np.searchsorted(cdf, np.random.random(), side='right')
         
         return self.semantic_neighbors[idx]
     
@@ -74,7 +120,7 @@ class SemanticField:
 # "Every attractor lives inside a higher attractor and generates smaller ones."
 # ============================================================================
 
-class AttractorLevel(Enum):
+class AttractorLevel(IntEnum):
     """Hierarchy of attractor nesting levels"""
     BASE = 0          # Deepest: Which dimension
     TONE = 1          # Sensory mechanism
@@ -86,7 +132,7 @@ class AttractorLevel(Enum):
     PLANETARY = 7     # Activation trigger
 
 
-@dataclass
+@dataclass(slots=True)
 class NestedAttractor:
     """
     Every attractor knows its parent and children.
@@ -133,18 +179,21 @@ class NestedAttractor:
         
         LAW VIII (Memory Deepening): Every collapse leaves residue.
         """
-        # Adjust gravity strength based on resonance
-        if feedback.get('resonance', 0) > 0.7:
+        self._apply_feedback(feedback.get('resonance', 0))
+        
+        # Propagate upward. Ancestors receive the wrapped child feedback,
+        # which carries no resonance of its own.
+        node = self.parent
+        while node is not None:
+            node._apply_feedback(0)
+            node = node.parent
+    
+    def _apply_feedback(self, resonance: float):
+        """Adjust gravity strength based on resonance"""
+        if resonance > 0.7:
             self.field.gravity_strength *= 1.05  # Strengthen attractor
-        elif feedback.get('resonance', 0) < 0.3:
+        elif resonance < 0.3:
             self.field.gravity_strength *= 0.95  # Weaken attractor
-        
-        # Propagate upward
-        if self.parent:
-            self.parent.receive_feedback({
-                'child_feedback': feedback,
-                'level': self.level
-            })
     
     def _calculate_distortion(self) -> float:
         """How much parent warps child's field"""
@@ -152,7 +201,7 @@ class NestedAttractor:
             return 0.0
         
         # Distance in hierarchy affects distortion
-        level_distance = abs(self.level.value - self.parent.level.value)
+        level_distance = abs(self.level - self.parent.level)
         return 1.0 / (1.0 + level_distance)
 
 
@@ -161,7 +210,7 @@ class NestedAttractor:
 # "Every attractor has an opposing attractor anchoring its stability."
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PolarityPair:
     """
     Attractors exist in tension with their opposites.
@@ -186,13 +235,14 @@ class PolarityPair:
             New position after oscillation step
         """
         # Oscillation governed by sine wave with damping
-        omega = 2 * np.pi * self.tension_coefficient  # Angular frequency
+        omega = 2 * math.pi * self.tension_coefficient  # Angular frequency
         damping = 0.1  # Prevents runaway oscillation
         
         # Simple harmonic motion with damping
-        delta = np.sin(omega * current_position) * (1 - damping * current_position)
+        delta = math.sin(omega * current_position) * (1 - damping * current_position)
         
-        new_position = np.clip(current_position + delta * 0.1, 0, 1)
+        new_position = current_position + delta * 0.1
+        new_position = 0.0 if new_position < 0.0 else (1.0 if new_position > 1.0 else new_position)
         
         return new_position
     
@@ -202,17 +252,10 @@ class PolarityPair:
         
         LAW IX (Harmonic Interference): Resonance amplifies, conflict fractures.
         """
-        # Primary wave
-        x = np.linspace(0, 2*np.pi, 100)
-        primary_wave = self.primary.field.gravity_strength * np.sin(x)
-        
-        # Shadow wave (opposite phase)
-        shadow_wave = self.shadow.field.gravity_strength * np.sin(x + np.pi)
-        
-        # Superposition
-        interference = primary_wave + shadow_wave
-        
-        return interference
+        # Superposition of primary wave and opposite-phase shadow wave:
+        # a*sin(x) + b*sin(x + pi) == (a - b)*sin(x)
+        return (self.primary.field.gravity_strength -
+                self.shadow.field.gravity_strength) * _POLARITY_SIN
 
 
 # ============================================================================
@@ -220,7 +263,31 @@ class PolarityPair:
 # "An attractor does not pull straight. It spirals."
 # ============================================================================
 
-@dataclass
+@njit('Tuple((float64[:], float64, float64))(float64, float64, float64, int64, float64)',
+      cache=True)
+def _spiral(state: float, velocity: float, damping: float,
+            steps: int, dt: float):
+    """Damped oscillation toward 0.5; returns (trajectory, state, velocity)"""
+    traj = np.empty(steps)
+    
+    for i in range(steps):
+        # Restoring force (pulls toward center at 0.5)
+        restoring_force = -(state - 0.5)
+        acceleration = restoring_force - damping * velocity
+        velocity += acceleration * dt
+        state += velocity * dt
+        
+        # Clamp to valid range
+        if state < 0.0:
+            state = 0.0
+        elif state > 1.0:
+            state = 1.0
+        traj[i] = state
+    
+    return traj, state, velocity
+
+
+@dataclass(slots=True)
 class OscillationDynamics:
     """
     Movement between polarities is never binary - it breathes.
@@ -238,18 +305,9 @@ class OscillationDynamics:
         
         This creates emotional waves, developmental arcs, human life.
         """
-        # Restoring force (pulls toward center at 0.5)
-        restoring_force = -(self.current_state - 0.5)
-        
-        # Update velocity
-        acceleration = restoring_force - self.damping * self.velocity
-        self.velocity += acceleration * time_step
-        
-        # Update position
-        self.current_state += self.velocity * time_step
-        
-        # Clamp to valid range
-        self.current_state = np.clip(self.current_state, 0, 1)
+        _, self.current_state, self.velocity = _spiral(
+            self.current_state, self.velocity, self.damping, 1, time_step
+        )
         
         return self.current_state
     
@@ -259,12 +317,11 @@ class OscillationDynamics:
         
         Not linear. Not binary. SPIRAL.
         """
-        trajectory = []
-        
-        for _ in range(steps):
-            trajectory.append(self.evolve())
+        trajectory, self.current_state, self.velocity = _spiral(
+            self.current_state, self.velocity, self.damping, steps, 0.1
+        )
         
-        return np.array(trajectory)
+        return trajectory
 
 
 # ============================================================================
@@ -272,7 +329,45 @@ class OscillationDynamics:
 # "There is no meaning outside context."
 # ============================================================================
 
-@dataclass
+class Planet(IntEnum):
+    """Activation triggers with a planetary emphasis weight"""
+    SUN = 0
+    MARS = 1
+    JUPITER = 2
+    SATURN = 3
+    PLUTO = 4
+    MERCURY = 5
+    VENUS = 6
+    MOON = 7
+
+
+class EmotionalState(IntEnum):
+    """Emotional field states with an accessibility weight"""
+    COHERENT_MOTION = 0
+    CONFLICTED_MOTION = 1
+    SUPPRESSED_MOTION = 2
+    ACCELERATED_MOTION = 3
+
+
+# Weights indexed by enum value.
+# Sun/Mars = stronger emphasis, Mercury/Venus = softer emphasis
+_PLANET_WEIGHTS = np.array([1.5, 1.4, 1.3, 1.2, 1.2, 0.9, 0.9, 1.0])
+_PLANET_WEIGHTS.setflags(write=False)
+
+_EMOTIONAL_WEIGHTS = np.array([
+    1.2,  # Clarity amplifies
+    0.7,  # Conflict dampens
+    0.5,  # Suppression blocks
+    1.5   # Overwhelm amplifies chaotically
+])
+_EMOTIONAL_WEIGHTS.setflags(write=False)
+
+# String names accepted at the API boundary ('Mars', 'coherent_motion')
+_PLANET_BY_NAME = MappingProxyType({p.name.title(): p for p in Planet})
+_EMOTIONAL_STATE_BY_NAME = MappingProxyType({e.name.lower(): e for e in EmotionalState})
+
+
+@dataclass(slots=True)
 class ContextStack:
     """
     The same attractor behaves differently in different contexts.
@@ -281,10 +376,23 @@ class ContextStack:
     """
     
     house: Optional[int] = None  # Life domain (1-12)
-    planet: Optional[str] = None  # Activation trigger
+    planet: Optional[Union[Planet, str]] = None  # Activation trigger
     dimension: Optional[str] = None  # Mind/Body/Individuality/Ego
     center: Optional[str] = None  # Biological anchor
-    emotional_field_state: Optional[str] = None  # coherent/conflicted/suppressed/accelerated
+    emotional_field_state: Optional[Union[EmotionalState, str]] = None  # coherent/conflicted/suppressed/accelerated
+    
+    def __post_init__(self):
+        # Resolve known names to enum codes once, so weighting is an array load
+        if isinstance(self.planet, str):
+            self.planet = _PLANET_BY_NAME.get(self.planet, self.planet)
+        if isinstance(self.emotional_field_state, str):
+            self.emotional_field_state = _EMOTIONAL_STATE_BY_NAME.get(
+                self.emotional_field_state, self.emotional_field_state
+            )
+    
+    def as_dict(self) -> Dict:
+        """Field values by name (slotted instances have no __dict__)"""
+        return {name: getattr(self, name) for name in self.__slots__}
     
     def compute_context_weight(self, attractor: NestedAttractor) -> float:
         """
@@ -301,7 +409,7 @@ class ContextStack:
             weight *= self._house_affinity(attractor, self.house)
         
         # Planetary modulation
-        if self.planet:
+        if self.planet is not None:
             weight *= self._planetary_emphasis(attractor, self.planet)
         
         # Dimensional modulation
@@ -309,7 +417,7 @@ class ContextStack:
             weight *= self._dimensional_compatibility(attractor, self.dimension)
         
         # Emotional field modulation
-        if self.emotional_field_state:
+        if self.emotional_field_state is not None:
             weight *= self._emotional_modulation(self.emotional_field_state)
         
         return weight
@@ -319,36 +427,27 @@ class ContextStack:
         # Placeholder - implement house-specific logic
         return 1.0
     
-    def _planetary_emphasis(self, attractor: NestedAttractor, planet: str) -> float:
+    def _planetary_emphasis(self, attractor: NestedAttractor,
+                            planet: Union[Planet, str]) -> float:
         """Planetary activation modulates expression"""
-        # Sun/Mars = stronger emphasis
-        # Mercury/Venus = softer emphasis
-        planet_weights = {
-            'Sun': 1.5,
-            'Mars': 1.4,
-            'Jupiter': 1.3,
-            'Saturn': 1.2,
-            'Pluto': 1.2,
-            'Mercury': 0.9,
-            'Venus': 0.9,
-            'Moon': 1.0
-        }
-        return planet_weights.get(planet, 1.0)
+        if not isinstance(planet, Planet):
+            planet = _PLANET_BY_NAME.get(planet)
+            if planet is None:
+                return 1.0
+        return _PLANET_WEIGHTS[planet]
     
     def _dimensional_compatibility(self, attractor: NestedAttractor, dimension: str) -> float:
         """Dimension lens affects how attractor expresses"""
         # Placeholder
         return 1.0
     
-    def _emotional_modulation(self, state: str) -> float:
+    def _emotional_modulation(self, state: Union[EmotionalState, str]) -> float:
         """Emotional field state changes attractor accessibility"""
-        emotional_weights = {
-            'coherent_motion': 1.2,  # Clarity amplifies
-            'conflicted_motion': 0.7,  # Conflict dampens
-            'suppressed_motion': 0.5,  # Suppression blocks
-            'accelerated_motion': 1.5  # Overwhelm amplifies chaotically
-        }
-        return emotional_weights.get(state, 1.0)
+        if not isinstance(state, EmotionalState):
+            state = _EMOTIONAL_STATE_BY_NAME.get(state)
+            if state is None:
+                return 1.0
+        return _EMOTIONAL_WEIGHTS[state]
 
 
 # ============================================================================
@@ -356,7 +455,43 @@ class ContextStack:
 # "Meaning does not exist until collapse."
 # ============================================================================
 
-@dataclass
+@njit('float64(float64, float64, float64, float64, float64, float64)',
+      cache=True, fastmath=True)
+def _ci_kernel(alpha: float, D: float, G: float, C: float,
+               tau: float, beta: float) -> float:
+    """Collapse integral CI = α × D × G × C × (1 - e^(-β×τ))"""
+    return alpha * D * G * C * (1.0 - math.exp(-beta * tau))
+
+
+@njit('boolean[:](float64[:], float64[:], float64[:], float64[:], '
+      'float64, float64, float64, float64[:], float64[:])',
+      parallel=True, cache=True, fastmath=True)
+def _collapse_batch(D, G, C, tau, alpha, beta, thr, grav_out, resonance):
+    """
+    Per-attractor CI, threshold and gravity update (LAW VII + VIII).
+    
+    Updates grav_out in place for collapsed entries; returns the hit mask.
+    """
+    n = D.shape[0]
+    out = np.empty(n, np.bool_)
+    
+    for i in prange(n):
+        ci = alpha * D[i] * G[i] * C[i] * (1.0 - math.exp(-beta * tau[i]))
+        hit = ci > thr
+        out[i] = hit
+        if hit:
+            r = resonance[i]
+            g = grav_out[i]
+            if r > 0.7:
+                g *= (1 + 0.1 * r)
+            elif r < 0.3:
+                g *= (1 - 0.1 * (1 - r))
+            grav_out[i] = 2.0 if g > 2.0 else (0.1 if g < 0.1 else g)
+    
+    return out
+
+
+@dataclass(slots=True)
 class CollapseEvent:
     """
     Probability becomes reality when measurement occurs.
@@ -381,10 +516,8 @@ class CollapseEvent:
         This is the collapse integral - when it exceeds threshold,
         probability field collapses into observable reality.
         """
-        CI = alpha * degree_precision * gate_strength * color_intensity * \
-             (1 - np.exp(-beta * time_since_init))
-        
-        return CI
+        return _ci_kernel(alpha, degree_precision, gate_strength,
+                          color_intensity, time_since_init, beta)
     
     def should_collapse(self, CI: float) -> bool:
         """Has collapse threshold been reached?"""
@@ -398,7 +531,7 @@ class CollapseEvent:
         """
         # Sample from the semantic field
         collapsed_meaning = self.attractor_field.sample_from_field(
-            context=self.context.__dict__
+            context=self.context.as_dict()
         )
         
         return collapsed_meaning
@@ -409,7 +542,7 @@ class CollapseEvent:
 # "Every collapse leaves residue."
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class MemoryTrace:
     """
     Every collapse modifies the probability field permanently.
@@ -429,60 +562,161 @@ class MemoryTrace:
         High resonance → deeper gravity well
         Low resonance → shallower gravity well
         """
-        # Bayesian-like update
-        if self.resonance_score > 0.7:
-            # This collapse felt TRUE - strengthen attractor
-            attractor.field.gravity_strength *= (1 + 0.1 * self.resonance_score)
-        elif self.resonance_score < 0.3:
-            # This collapse felt FALSE - weaken attractor
-            attractor.field.gravity_strength *= (1 - 0.1 * (1 - self.resonance_score))
-        
-        # Clamp gravity to valid range
-        attractor.field.gravity_strength = np.clip(
-            attractor.field.gravity_strength,
-            0.1,  # Minimum gravity (never fully disappears)
-            2.0   # Maximum gravity (prevents runaway)
-        )
+        _update_gravity(attractor, self.resonance_score)
         
         return attractor
 
 
+def _update_gravity(attractor: NestedAttractor, resonance: float):
+    """Bayesian-like gravity update shared by MemoryTrace and the engine"""
+    g = attractor.field.gravity_strength
+    
+    if resonance > 0.7:
+        # This collapse felt TRUE - strengthen attractor
+        g *= (1 + 0.1 * resonance)
+    elif resonance < 0.3:
+        # This collapse felt FALSE - weaken attractor
+        g *= (1 - 0.1 * (1 - resonance))
+    
+    # Clamp gravity to valid range: minimum 0.1 (never fully
+    # disappears), maximum 2.0 (prevents runaway)
+    attractor.field.gravity_strength = 2.0 if g > 2.0 else (0.1 if g < 0.1 else g)
+
+
+class MemoryTraceBuffer:
+    """
+    Fixed-capacity ring buffer of memory traces, stored column-wise.
+    
+    Resonance is quantized to uint8 (1/255 steps) and timestamps to
+    float32; contexts are interned by value and referenced by id. Once
+    full, the oldest trace is overwritten. Indexing and iteration yield
+    MemoryTrace views in chronological order.
+    """
+    
+    def __init__(self, capacity: int = 4096):
+        self.capacity = capacity
+        self._resonance_q = np.zeros(capacity, dtype=np.uint8)
+        self._timestamp = np.zeros(capacity, dtype=np.float32)
+        self._ctx_id = np.zeros(capacity, dtype=np.int32)
+        self._attractor_id = np.full(capacity, -1, dtype=np.int32)
+        self._collapsed_state = np.empty(capacity, dtype=object)
+        self._head = 0  # next slot to write
+        self._count = 0
+        
+        self._contexts: List[ContextStack] = []
+        self._context_ids: Dict[tuple, int] = {}
+    
+    def record(self,
+               collapsed_state: str,
+               resonance: float,
+               timestamp: float,
+               context: ContextStack,
+               attractor_id: int = -1):
+        """Write one trace into the next slot"""
+        key = (context.house, context.planet, context.dimension,
+               context.center, context.emotional_field_state)
+        ctx_id = self._context_ids.get(key)
+        if ctx_id is None:
+            ctx_id = len(self._contexts)
+            self._contexts.append(context)
+            self._context_ids[key] = ctx_id
+        
+        q = round(resonance * 255)
+        
+        i = self._head
+        self._resonance_q[i] = 255 if q > 255 else (0 if q < 0 else q)
+        self._timestamp[i] = timestamp
+        self._ctx_id[i] = ctx_id
+        self._attractor_id[i] = attractor_id
+        self._collapsed_state[i] = collapsed_state
+        
+        self._head = (i + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+    
+    def append(self, trace: MemoryTrace):
+        """List-style append of a MemoryTrace"""
+        self.record(trace.collapsed_state, trace.resonance_score,
+                    trace.timestamp, trace.context)
+    
+    def _slots(self) -> np.ndarray:
+        """Physical slot indices, oldest first"""
+        start = (self._head - self._count) % self.capacity
+        return (start + np.arange(self._count)) % self.capacity
+    
+    def resonance_scores(self) -> np.ndarray:
+        """Dequantized resonance of all traces, oldest first"""
+        return self._resonance_q[self._slots()] / 255.0
+    
+    def attractor_ids(self) -> np.ndarray:
+        """Attractor id of all traces, oldest first (-1 if unknown)"""
+        return self._attractor_id[self._slots()]
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __getitem__(self, index: int) -> MemoryTrace:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('memory trace index out of range')
+        
+        i = (self._head - self._count + index) % self.capacity
+        return MemoryTrace(
+            collapsed_state=self._collapsed_state[i],
+            resonance_score=int(self._resonance_q[i]) / 255.0,
+            timestamp=float(self._timestamp[i]),
+            context=self._contexts[self._ctx_id[i]]
+        )
+    
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+
 # ============================================================================
 # LAW IX: THE LAW OF HARMONIC INTERFERENCE
 # "When two attractors resonate, they amplify. When they conflict, they fracture."
 # ============================================================================
 
+@njit('float64(float64, float64)', cache=True, fastmath=True)
+def _interference_coeff_only(a_grav: float, b_grav: float) -> float:
+    """Branchless interference coefficient for two gravity strengths"""
+    d = abs(a_grav - b_grav)
+    return 1.0 + 2.0 * max(0.0, 0.3 - d) - 2.0 * max(0.0, d - 0.7)
+
+
+def _interference_coeff_vec(grav: np.ndarray) -> np.ndarray:
+    """Pairwise interference coefficient matrix for a vector of gravities"""
+    d = np.abs(grav[:, None] - grav[None, :])
+    return 1.0 + 2.0 * np.maximum(0.0, 0.3 - d) - 2.0 * np.maximum(0.0, d - 0.7)
+
+
+# Interference pattern codes returned by calculate_interference
+CONSTRUCTIVE, PARTIAL, DESTRUCTIVE = 0, 1, 2
+_PATTERN_NAMES = ('constructive', 'partial', 'destructive')
+
+
 def calculate_interference(attractor_a: NestedAttractor,
-                          attractor_b: NestedAttractor) -> Tuple[float, str]:
+                          attractor_b: NestedAttractor) -> Tuple[float, int]:
     """
     When two attractors interact, they create interference patterns.
     
     LAW IX: Constructive = coherence. Destructive = fragmentation.
     
     Returns:
-        (interference_coefficient, pattern_type)
+        (interference_coefficient, pattern_code); _PATTERN_NAMES[pattern_code]
+        gives the pattern name
     """
     # Calculate phase relationship
-    phase_diff = abs(
-        attractor_a.field.gravity_strength - attractor_b.field.gravity_strength
-    )
-    
-    # Constructive interference (in phase)
-    if phase_diff < 0.3:
-        interference_coeff = 1.0 + (0.3 - phase_diff) * 2
-        pattern_type = 'constructive'
+    a_grav = attractor_a.field.gravity_strength
+    b_grav = attractor_b.field.gravity_strength
+    phase_diff = abs(a_grav - b_grav)
     
-    # Destructive interference (out of phase)
-    elif phase_diff > 0.7:
-        interference_coeff = 1.0 - (phase_diff - 0.7) * 2
-        pattern_type = 'destructive'
-    
-    # Partial interference
-    else:
-        interference_coeff = 1.0
-        pattern_type = 'partial'
+    # In phase = constructive, out of phase = destructive, else partial
+    pattern_code = int(phase_diff >= 0.3) + int(phase_diff > 0.7)
     
-    return interference_coeff, pattern_type
+    return _interference_coeff_only(a_grav, b_grav), pattern_code
 
 
 # ============================================================================
@@ -490,6 +724,14 @@ def calculate_interference(attractor_a: NestedAttractor,
 # "Identity is not inside the system. Identity is what the system produces."
 # ============================================================================
 
+# Source attractor pairs in (body, mind, individuality, ego) index order
+_PAIR_I, _PAIR_J = np.triu_indices(4, k=1)
+_PAIR_NAMES = (
+    'Body-Mind', 'Body-Individuality', 'Body-Ego',
+    'Mind-Individuality', 'Mind-Ego', 'Individuality-Ego'
+)
+
+
 @dataclass
 class EmergentIdentity:
     """
@@ -510,65 +752,54 @@ class EmergentIdentity:
         
         This IS Personality - not a thing, but a PATTERN.
         """
-        # Calculate pairwise interference
-        bm_interference, bm_type = calculate_interference(
-            self.body_attractor,
-            self.mind_attractor
-        )
-        
-        bi_interference, bi_type = calculate_interference(
-            self.body_attractor,
-            self.individuality_attractor
+        total_interference, identity_pattern, pair_codes = _identity_hologram(
+            self.body_attractor.field.gravity_strength,
+            self.mind_attractor.field.gravity_strength,
+            self.individuality_attractor.field.gravity_strength,
+            self.ego_attractor.field.gravity_strength
         )
         
-        be_interference, be_type = calculate_interference(
-            self.body_attractor,
-            self.ego_attractor
-        )
-        
-        mi_interference, mi_type = calculate_interference(
-            self.mind_attractor,
-            self.individuality_attractor
-        )
-        
-        me_interference, me_type = calculate_interference(
-            self.mind_attractor,
-            self.ego_attractor
-        )
-        
-        ie_interference, ie_type = calculate_interference(
-            self.individuality_attractor,
-            self.ego_attractor
-        )
-        
-        # Compute overall coherence
-        total_interference = (
-            bm_interference + bi_interference + be_interference +
-            mi_interference + me_interference + ie_interference
-        ) / 6.0
-        
-        # Determine dominant pattern
-        if total_interference > 1.2:
-            identity_pattern = 'coherent_unified'
-        elif total_interference < 0.8:
-            identity_pattern = 'fragmented_conflicted'
-        else:
-            identity_pattern = 'complex_multifaceted'
-        
         return {
             'hologram_coherence': total_interference,
             'identity_pattern': identity_pattern,
             'interference_pairs': {
-                'Body-Mind': bm_type,
-                'Body-Individuality': bi_type,
-                'Body-Ego': be_type,
-                'Mind-Individuality': mi_type,
-                'Mind-Ego': me_type,
-                'Individuality-Ego': ie_type
+                name: _PATTERN_NAMES[code]
+                for name, code in zip(_PAIR_NAMES, pair_codes)
             }
         }
 
 
+@functools.lru_cache(maxsize=4096)
+def _identity_hologram(g_body: float, g_mind: float,
+                       g_individuality: float, g_ego: float) -> Tuple[float, str, Tuple[int, ...]]:
+    """
+    Hologram for four source gravities, memoized on their exact values.
+    
+    Gravity only changes on feedback and collapse, so re-rendering an
+    unchanged identity is a cache hit.
+    """
+    # Pairwise interference over the upper triangle of the 4x4 gravity
+    # difference matrix: B-M, B-I, B-E, M-I, M-E, I-E
+    g = np.array([g_body, g_mind, g_individuality, g_ego], dtype=np.float64)
+    coeffs = _interference_coeff_vec(g)[_PAIR_I, _PAIR_J]
+    
+    d6 = np.abs(g[_PAIR_I] - g[_PAIR_J])
+    pair_codes = tuple(((d6 >= 0.3).astype(np.int64) + (d6 > 0.7)).tolist())
+    
+    # Compute overall coherence
+    total_interference = float(coeffs.mean())
+    
+    # Determine dominant pattern
+    if total_interference > 1.2:
+        identity_pattern = 'coherent_unified'
+    elif total_interference < 0.8:
+        identity_pattern = 'fragmented_conflicted'
+    else:
+        identity_pattern = 'complex_multifaceted'
+    
+    return total_interference, identity_pattern, pair_codes
+
+
 # ============================================================================
 # UNIFIED ATTRACTOR ENGINE
 # ============================================================================
@@ -580,10 +811,11 @@ class AttractorEngine:
     Enforces all 10 Constitutional Laws.
     """
     
-    def __init__(self):
+    def __init__(self, trace_capacity: int = 4096):
         self.attractors: Dict[str, NestedAttractor] = {}
+        self.attractor_ids: Dict[str, int] = {}
         self.polarity_pairs: List[PolarityPair] = []
-        self.memory_traces: List[MemoryTrace] = []
+        self.memory_traces = MemoryTraceBuffer(trace_capacity)
     
     def register_attractor(self,
                           name: str,
@@ -605,6 +837,7 @@ class AttractorEngine:
             parent.children.append(attractor)
         
         self.attractors[name] = attractor
+        self.attractor_ids.setdefault(name, len(self.attractor_ids))
         
         return attractor
     
@@ -641,33 +874,104 @@ class AttractorEngine:
         """
         attractor = self.attractors[attractor_name]
         
-        collapse_event = CollapseEvent(
-            attractor_field=attractor.field,
-            context=context
+        collapsed_meaning = self._fast_collapse(
+            attractor,
+            context,
+            collapse_params['degree_precision'],
+            collapse_params['gate_strength'],
+            collapse_params['color_intensity'],
+            collapse_params['time_since_init'],
+            collapse_params.get('alpha', 1.0),
+            collapse_params.get('beta', 0.5),
+            collapse_params.get('resonance', 0.5),
+            collapse_params.get('time_since_init', 0.0),
+            attractor_id=self.attractor_ids[attractor_name]
         )
         
+        if collapsed_meaning is None:
+            return "[Field has not collapsed - insufficient CI]"
+        return collapsed_meaning
+    
+    def _fast_collapse(self,
+                       attractor: NestedAttractor,
+                       ctx: ContextStack,
+                       D: float, G: float, C: float, tau: float,
+                       alpha: float, beta: float,
+                       resonance: float, ts: float,
+                       threshold: float = 0.7,
+                       attractor_id: int = -1) -> Optional[str]:
+        """
+        Fused CI + collapse + memory update on primitive arguments.
+        
+        Same semantics as CollapseEvent, without constructing one; returns
+        None (allocating nothing) when CI does not exceed threshold.
+        """
         # Calculate CI
-        CI = collapse_event.calculate_collapse_probability(**collapse_params)
-        
-        if collapse_event.should_collapse(CI):
-            collapsed_meaning = collapse_event.execute_collapse()
-            
-            # Create memory trace (LAW VIII)
-            trace = MemoryTrace(
-                collapsed_state=collapsed_meaning,
-                resonance_score=collapse_params.get('resonance', 0.5),
-                timestamp=collapse_params.get('time_since_init', 0.0),
-                context=context
-            )
-            
-            self.memory_traces.append(trace)
-            
-            # Update attractor gravity
-            trace.update_attractor_gravity(attractor)
-            
-            return collapsed_meaning
+        if _ci_kernel(alpha, D, G, C, tau, beta) <= threshold:
+            return None
+        
+        collapsed_meaning = attractor.field.sample_from_field(context=ctx.as_dict())
+        
+        # Record memory trace (LAW VIII)
+        self.memory_traces.record(collapsed_meaning, resonance, ts, ctx,
+                                  attractor_id)
+        
+        # Update attractor gravity
+        _update_gravity(attractor, resonance)
+        
+        return collapsed_meaning
+    
+    def collapse_batch(self,
+                       names: List[str],
+                       params: Dict[str, np.ndarray],
+                       threshold: float = 0.7) -> np.ndarray:
+        """
+        Collapse many attractors in one pass.
+        
+        params holds degree_precision, gate_strength, color_intensity,
+        time_since_init and optional resonance (arrays aligned with names,
+        or scalars) plus optional scalar alpha/beta. Gravity of every
+        collapsed attractor is updated as in LAW VIII; names are expected
+        to be distinct. No sampling or memory traces happen here.
+        
+        Returns the boolean mask CI > threshold.
+        """
+        attractors = [self.attractors[name] for name in names]
+        n = len(attractors)
+        
+        def column(value) -> np.ndarray:
+            # Fresh writable float64 array (the kernel signature rejects
+            # read-only broadcast views)
+            out = np.empty(n, dtype=np.float64)
+            out[:] = value
+            return out
+        
+        D = column(params['degree_precision'])
+        G = column(params['gate_strength'])
+        C = column(params['color_intensity'])
+        tau = column(params['time_since_init'])
+        resonance = column(params.get('resonance', 0.5))
+        alpha = float(params.get('alpha', 1.0))
+        beta = float(params.get('beta', 0.5))
+        
+        gravity = np.fromiter(
+            (a.field.gravity_strength for a in attractors), np.float64, n
+        )
+        
+        if NUMBA_AVAILABLE:
+            hits = _collapse_batch(D, G, C, tau, alpha, beta, float(threshold),
+                                   gravity, resonance)
         else:
-            return "[Field has not collapsed - insufficient CI]"
+            # Same arithmetic as _collapse_batch, vectorized
+            hits = alpha * D * G * C * (1.0 - np.exp(-beta * tau)) > threshold
+            scale = np.where(resonance > 0.7, 1 + 0.1 * resonance,
+                             np.where(resonance < 0.3, 1 - 0.1 * (1 - resonance), 1.0))
+            gravity = np.where(hits, np.clip(gravity * scale, 0.1, 2.0), gravity)
+        
+        for i in np.flatnonzero(hits):
+            attractors[i].field.gravity_strength = float(gravity[i])
+        
+        return hits
 
 
 # ============================================================================
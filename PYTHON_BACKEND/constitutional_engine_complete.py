@@ -8,10 +8,25 @@ Laws XI-XIV: Field Constraint Mechanics
 These are not metaphors. These are operating conditions of reality.
 """
 
+import functools
+import math
 import numpy as np
-from typing import Dict, List, Tuple, Optional, Callable
-from dataclasses import dataclass, field
-from enum import Enum
+from typing import Dict, List, Tuple, Optional, Callable, Union
+from dataclasses import dataclass, field, InitVar
+from enum import Enum, IntEnum
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
 
 
 # ============================================================================
@@ -31,7 +46,7 @@ class Element(Enum):
     AETHER = 5    # Field / Space / Illusion / "I Think"
 
 
-@dataclass
+@dataclass(slots=True)
 class ElementalLaw:
     """
     Each element has specific movement constraints.
@@ -124,6 +139,90 @@ ELEMENTAL_LAWS = {
 # "Nothing is real unless the Base allows it."
 # ============================================================================
 
+# Placeholder gate mappings - implement actual gate mapping
+# Body gates: simplified to the first 20 gates of the wheel sequence
+_BODY_GATES: frozenset = frozenset([3, 27, 24, 2, 23, 8, 20, 16, 35, 45, 12, 15, 52, 39, 53, 62, 56, 31, 33, 7])
+_MENTAL_GATES: frozenset = frozenset([47, 24, 4, 17, 43, 11, 62, 63, 64])
+
+
+def _gate_mask(gates) -> np.uint64:
+    """Bit (gate - 1) set for each gate in 1-64"""
+    mask = 0
+    for gate in gates:
+        mask |= 1 << (gate - 1)
+    return np.uint64(mask)
+
+
+_BODY_GATE_MASK = _gate_mask(_BODY_GATES)
+_MENTAL_GATE_MASK = _gate_mask(_MENTAL_GATES)
+
+# ELEMENTAL_LAWS compiled to bit tables: every forbidden behavior and
+# required condition gets a bit (in declaration order), and each element
+# gets a mask row indexed by Element.value - 1.
+_BEHAVIOR_NAMES = tuple(b for law in ELEMENTAL_LAWS.values() for b in law.forbidden_behaviors)
+_REQUIREMENT_NAMES = tuple(r for law in ELEMENTAL_LAWS.values() for r in law.required_conditions)
+_BEHAVIOR_BITS = {name: 1 << i for i, name in enumerate(_BEHAVIOR_NAMES)}
+_REQUIREMENT_BITS = {name: 1 << i for i, name in enumerate(_REQUIREMENT_NAMES)}
+_ALL_REQUIREMENTS = (1 << len(_REQUIREMENT_NAMES)) - 1
+
+_FORBIDDEN_MASKS = np.array([
+    sum(_BEHAVIOR_BITS[b] for b in ELEMENTAL_LAWS[element].forbidden_behaviors)
+    for element in sorted(Element, key=lambda e: e.value)
+], dtype=np.uint64)
+_REQUIRED_MASKS = np.array([
+    sum(_REQUIREMENT_BITS[r] for r in ELEMENTAL_LAWS[element].required_conditions)
+    for element in sorted(Element, key=lambda e: e.value)
+], dtype=np.uint64)
+
+
+@njit('int64(int64, uint64, uint64)', cache=True)
+def _first_elemental_violation(base_idx: int, exhibited: np.uint64, satisfied: np.uint64) -> int:
+    """
+    -1 if the element's law holds; otherwise the bit of the first forbidden
+    behavior exhibited, or 64 + the bit of the first unmet requirement.
+    """
+    violated = _FORBIDDEN_MASKS[base_idx] & exhibited
+    missing = _REQUIRED_MASKS[base_idx] & ~satisfied
+    one = np.uint64(1)
+    for b in range(64):
+        if (violated >> np.uint64(b)) & one:
+            return b
+    for b in range(64):
+        if (missing >> np.uint64(b)) & one:
+            return 64 + b
+    return -1
+
+
+# Result codes of _validate_hierarchy (0 = consistent)
+_HIERARCHY_VIOLATIONS = (
+    None,
+    "Hierarchical inconsistency detected: Aether base cannot carry Body-layer authority",
+    "Hierarchical inconsistency detected: Matter base cannot express purely mental concepts",
+)
+
+
+@njit('int64(int64, int64, int64, int64, int64)', cache=True)
+def _validate_hierarchy(base_int: int, color: int, tone: int, line: int, gate: int) -> int:
+    """
+    Verify that higher layers don't violate lower layer constraints.
+    
+    Returns 0 if consistent, otherwise an index into _HIERARCHY_VIOLATIONS.
+    """
+    if gate < 1 or gate > 64:
+        return 0
+    bit = np.uint64(1) << np.uint64(gate - 1)
+    
+    # Base 5 (Aether) cannot carry Body-layer authority
+    if base_int == 5 and (_BODY_GATE_MASK & bit) != 0:
+        return 1
+    
+    # Base 3 (Matter) cannot express purely mental concepts
+    if base_int == 3 and (_MENTAL_GATE_MASK & bit) != 0:
+        return 2
+    
+    return 0
+
+
 class ElementalValidator:
     """
     Enforces elemental objectivity across all collapse events.
@@ -147,33 +246,76 @@ class ElementalValidator:
         Returns:
             (is_valid, violation_reason)
         """
-        law = self.laws[base]
-        
-        # Check forbidden behaviors
-        for forbidden in law.forbidden_behaviors:
-            if self._violates_constraint(proposed_expression, forbidden):
-                return False, f"Violates elemental law: {forbidden}"
-        
-        # Check required conditions
-        for required in law.required_conditions:
-            if not self._satisfies_requirement(proposed_expression, required):
-                return False, f"Does not satisfy requirement: {required}"
+        # Check forbidden behaviors, then required conditions
+        bit = _first_elemental_violation(
+            base.value - 1,
+            np.uint64(self._exhibited_behaviors(proposed_expression)),
+            np.uint64(self._satisfied_requirements(proposed_expression))
+        )
+        if bit >= 64:
+            return False, f"Does not satisfy requirement: {_REQUIREMENT_NAMES[bit - 64]}"
+        if bit >= 0:
+            return False, f"Violates elemental law: {_BEHAVIOR_NAMES[bit]}"
         
         # Check hierarchical consistency
-        if not self._check_hierarchical_consistency(base, color, tone, line, gate):
-            return False, "Hierarchical inconsistency detected"
+        code = _validate_hierarchy(base.value, color, tone, line, gate)
+        if code:
+            return False, _HIERARCHY_VIOLATIONS[code]
         
         return True, None
     
-    def _violates_constraint(self, expression: str, constraint: str) -> bool:
-        """Check if expression violates elemental constraint"""
+    def validate_collapse_vec(self,
+                              bases: np.ndarray,
+                              colors: np.ndarray,
+                              tones: np.ndarray,
+                              lines: np.ndarray,
+                              gates: np.ndarray,
+                              exhibited: Optional[np.ndarray] = None,
+                              satisfied: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        validate_collapse over whole arrays of activations (e.g. a chart).
+        
+        bases holds Element values (1-5). exhibited/satisfied are per-row
+        _BEHAVIOR_BITS/_REQUIREMENT_BITS masks; they default to what the
+        placeholder hooks report for any expression.
+        
+        Returns:
+            Boolean array, True where the collapse is legal
+        """
+        bases = np.asarray(bases, dtype=np.int64)
+        gates = np.asarray(gates, dtype=np.int64)
+        
+        # Elemental law (forbidden behaviors and required conditions)
+        if exhibited is None:
+            exhibited = np.uint64(self._exhibited_behaviors(''))
+        if satisfied is None:
+            satisfied = np.uint64(self._satisfied_requirements(''))
+        exhibited = np.asarray(exhibited, dtype=np.uint64)
+        satisfied = np.asarray(satisfied, dtype=np.uint64)
+        
+        ok = ((_FORBIDDEN_MASKS[bases - 1] & exhibited) == 0) & \
+             ((_REQUIRED_MASKS[bases - 1] & ~satisfied) == 0)
+        
+        # Hierarchical consistency (gates outside 1-64 are unchecked)
+        in_range = (gates >= 1) & (gates <= 64)
+        shift = np.where(in_range, gates - 1, 0).astype(np.uint64)
+        is_body = in_range & (((_BODY_GATE_MASK >> shift) & np.uint64(1)) != 0)
+        is_mental = in_range & (((_MENTAL_GATE_MASK >> shift) & np.uint64(1)) != 0)
+        
+        ok &= ~((bases == Element.AETHER.value) & is_body)
+        ok &= ~((bases == Element.MATTER.value) & is_mental)
+        
+        return ok
+    
+    def _exhibited_behaviors(self, expression: str) -> int:
+        """Bitmask (see _BEHAVIOR_BITS) of forbidden behaviors the expression exhibits"""
         # Placeholder - implement actual semantic checking
-        return False
+        return 0
     
-    def _satisfies_requirement(self, expression: str, requirement: str) -> bool:
-        """Check if expression satisfies elemental requirement"""
+    def _satisfied_requirements(self, expression: str) -> int:
+        """Bitmask (see _REQUIREMENT_BITS) of requirements the expression satisfies"""
         # Placeholder - implement actual semantic checking
-        return True
+        return _ALL_REQUIREMENTS
     
     def _check_hierarchical_consistency(self,
                                        base: Element,
@@ -186,27 +328,15 @@ class ElementalValidator:
         
         Base → Tone → Color → Line → Gate must be consistent.
         """
-        # Base 5 (Aether) cannot carry Body-layer authority
-        if base == Element.AETHER and self._is_body_expression(gate, line):
-            return False
-        
-        # Base 3 (Matter) cannot express purely mental concepts
-        if base == Element.MATTER and self._is_pure_mental(gate, line):
-            return False
-        
-        return True
+        return _validate_hierarchy(base.value, color, tone, line, gate) == 0
     
     def _is_body_expression(self, gate: int, line: int) -> bool:
         """Check if gate/line is Body-layer expression"""
-        # Placeholder - implement actual gate mapping
-        body_gates = [3, 27, 24, 2, 23, 8, 20, 16, 35, 45, 12, 15, 52, 39, 53, 62, 56, 31, 33, 7, 4, 29, 59, 40, 64, 47, 6, 46, 18, 48, 57, 32, 50, 28, 44, 1, 43, 14, 34, 9, 5, 26, 11, 10, 58, 38, 54, 61, 60, 41, 19, 13, 49, 30, 55, 37, 22, 36, 25, 17, 21, 51, 42, 3, 27, 24]
-        return gate in body_gates[:20]  # Simplified check
+        return gate in _BODY_GATES
     
     def _is_pure_mental(self, gate: int, line: int) -> bool:
         """Check if gate/line is pure mental expression"""
-        # Placeholder
-        mental_gates = [47, 24, 4, 17, 43, 11, 62, 63, 64]
-        return gate in mental_gates
+        return gate in _MENTAL_GATES
 
 
 # ============================================================================
@@ -214,7 +344,7 @@ class ElementalValidator:
 # "Nothing dominates the field unless it wins by resonance, not preference."
 # ============================================================================
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class ResonanceField:
     """
     Coherence determines authority, not volume.
@@ -222,8 +352,27 @@ class ResonanceField:
     LAW XII: Phase agreement > emotional intensity
     """
     
-    field_components: List[float]  # Amplitude of each component
-    phase_angles: List[float]  # Phase of each component
+    field_components: np.ndarray  # Amplitude of each component
+    phase_angles: np.ndarray  # Phase of each component
+    _phasors: np.ndarray = field(init=False, repr=False)
+    _amp_sum: float = field(init=False, repr=False)
+    _coherence: Optional[float] = field(init=False, repr=False, default=None)
+    
+    def __post_init__(self):
+        self.field_components = np.asarray(self.field_components, dtype=np.float64)
+        self.phase_angles = np.asarray(self.phase_angles, dtype=np.float64)
+        self.invalidate()
+    
+    def invalidate(self):
+        """
+        Rebuild derived state and drop the cached coherence.
+        
+        Call after mutating field_components or phase_angles.
+        """
+        # Unit complex representation of each phase, reused across calls
+        self._phasors = np.exp(1j * self.phase_angles)
+        self._amp_sum = float(self.field_components.sum())
+        self._coherence = None
     
     def calculate_coherence(self) -> float:
         """
@@ -231,18 +380,33 @@ class ResonanceField:
         
         Coherence = constructive interference strength
         """
-        # Convert to complex representation
-        complex_field = [
-            amp * np.exp(1j * phase)
-            for amp, phase in zip(self.field_components, self.phase_angles)
-        ]
+        if self._coherence is None:
+            if self._amp_sum == 0:
+                self._coherence = 0.0
+            else:
+                # Coherence = |total| / sum(|components|)
+                self._coherence = float(
+                    abs(np.dot(self.field_components, self._phasors)) / self._amp_sum
+                )
         
-        # Sum all components
-        total_field = sum(complex_field)
+        return self._coherence
+    
+    @staticmethod
+    def calculate_coherence_batch(field_components: np.ndarray,
+                                  phase_angles: np.ndarray) -> np.ndarray:
+        """
+        calculate_coherence for each row of (N, K) amplitude/phase matrices.
+        
+        Rows whose amplitudes sum to zero get coherence 0.
+        """
+        amps = np.asarray(field_components, dtype=np.float64)
+        phases = np.asarray(phase_angles, dtype=np.float64)
         
-        # Coherence = |total| / sum(|components|)
-        coherence = abs(total_field) / sum(self.field_components)
+        amp_sum = amps.sum(axis=1)
+        total = np.abs((amps * np.exp(1j * phases)).sum(axis=1))
         
+        coherence = np.zeros(len(amps))
+        np.divide(total, amp_sum, out=coherence, where=amp_sum != 0)
         return coherence
     
     def has_authority(self, threshold: float = 0.7) -> bool:
@@ -296,6 +460,29 @@ class PlanetaryWeight(Enum):
     SOUTH_NODE = 0.85  # Karma
 
 
+class Layer(IntEnum):
+    """Layers of the causal graph, ordered from most to least authority"""
+    BASE = 0           # Elemental substrate - HIGHEST authority
+    TONE = 1           # Sensory mechanism
+    COLOR = 2          # Motivation
+    LINE = 3           # Behavioral structure
+    GATE = 4           # Archetypal action
+    PLANET = 5         # Temporal trigger
+    DIMENSION = 6      # Lens
+    CENTER = 7         # Biological expression
+    PERSONALITY = 8    # Emergent hologram - LOWEST authority
+
+
+# Authority weight per Layer (read-only)
+_AUTHORITY = np.array([1.0, 0.9, 0.8, 0.7, 0.6, 0.5, 0.4, 0.3, 0.2])
+_AUTHORITY.flags.writeable = False
+
+# Layer names as used at the string API boundary ('Base', 'Tone', ...)
+_LAYER_BY_NAME = {layer.name.capitalize(): layer for layer in Layer}
+
+_DEFAULT_AUTHORITY = 0.5
+
+
 @dataclass
 class HarmonicHierarchy:
     """
@@ -304,29 +491,22 @@ class HarmonicHierarchy:
     LAW XIII: Nothing higher overrides anything lower without permission.
     """
     
-    def get_authority_weight(self, level: str) -> float:
+    def get_authority_weight(self, level: Union[Layer, str]) -> float:
         """
         Each layer has inherent authority weight.
         
         Lower layers (Base) have MORE authority than higher layers (Personality).
+        Accepts a Layer or its name; unknown names get a middle weight.
         """
-        hierarchy = {
-            'Base': 1.0,           # Elemental substrate - HIGHEST authority
-            'Tone': 0.9,           # Sensory mechanism
-            'Color': 0.8,          # Motivation
-            'Line': 0.7,           # Behavioral structure
-            'Gate': 0.6,           # Archetypal action
-            'Planet': 0.5,         # Temporal trigger
-            'Dimension': 0.4,      # Lens
-            'Center': 0.3,         # Biological expression
-            'Personality': 0.2     # Emergent hologram - LOWEST authority
-        }
-        
-        return hierarchy.get(level, 0.5)
+        if not isinstance(level, Layer):
+            level = _LAYER_BY_NAME.get(level)
+            if level is None:
+                return _DEFAULT_AUTHORITY
+        return float(_AUTHORITY[level])
     
     def can_override(self,
-                    higher_level: str,
-                    lower_level: str,
+                    higher_level: Union[Layer, str],
+                    lower_level: Union[Layer, str],
                     harmonic_permission: float) -> bool:
         """
         Check if higher layer can override lower layer.
@@ -351,10 +531,16 @@ class HarmonicHierarchy:
         
         Pluto activation >> Moon activation in terms of fate inevitability.
         """
-        try:
-            return PlanetaryWeight[planet.upper().replace(' ', '_')].value
-        except KeyError:
-            return 0.5  # Default middle weight
+        return _planetary_emphasis(planet)
+
+
+@functools.lru_cache(maxsize=64)
+def _planetary_emphasis(planet: str) -> float:
+    """PlanetaryWeight lookup by display name, memoized per name"""
+    try:
+        return PlanetaryWeight[planet.upper().replace(' ', '_')].value
+    except KeyError:
+        return 0.5  # Default middle weight
 
 
 # ============================================================================
@@ -379,6 +565,57 @@ class TemporalOctave(Enum):
     PLUTONIAN = 9   # ~248 years - transformation cycles
 
 
+# Phase index of each octave in TemporalWaveFunction.phases
+_OCTAVE_INDEX = {octave: octave.value - 1 for octave in TemporalOctave}
+
+# Orbital period (days) of each octave, in _OCTAVE_INDEX order
+_OCTAVE_PERIODS = np.array([
+    28.0,       # LUNAR
+    88.0,       # MERCURIAL
+    225.0,      # VENUSIAN
+    687.0,      # MARTIAN
+    4333.0,     # JOVIAN (~12 years)
+    10592.0,    # SATURNIAN (~29 years)
+    30687.0,    # URANIAN (~84 years)
+    60266.0,    # NEPTUNIAN (~165 years)
+    90553.0     # PLUTONIAN (~248 years)
+])
+_TWO_PI = 2 * np.pi
+_OCTAVE_ANGULAR_VELOCITY = _TWO_PI / _OCTAVE_PERIODS
+_OCTAVE_ANGULAR_VELOCITY.flags.writeable = False
+
+# Importance weight of each octave (octave.value / 9)
+_OCTAVE_WEIGHTS = np.arange(1, 10, dtype=np.float64) / 9.0
+_OCTAVE_WEIGHTS.flags.writeable = False
+
+# Phasor steps between renormalizations (bounds |z| rounding drift)
+_RENORM_INTERVAL = 64
+
+# Distinct step sizes whose rotation phasors a wave function keeps
+_MAX_CACHED_STEPS = 64
+
+
+@njit('float64(float64[:])', cache=True, fastmath=True)
+def _wave_tension_kernel(sines):
+    """Mean of |sin(phase)| × octave weight, without temporaries"""
+    s = 0.0
+    for i in range(sines.shape[0]):
+        s += abs(sines[i]) * _OCTAVE_WEIGHTS[i]
+    return s / sines.shape[0]
+
+
+@njit('float64[:](float64[:, :])', parallel=True, cache=True, fastmath=True)
+def _wave_tension_batch_kernel(traj):
+    """_wave_tension_kernel for each row of a (T, 9) trajectory"""
+    out = np.empty(traj.shape[0])
+    for t in prange(traj.shape[0]):
+        s = 0.0
+        for i in range(traj.shape[1]):
+            s += abs(math.sin(traj[t, i])) * _OCTAVE_WEIGHTS[i]
+        out[t] = s / traj.shape[1]
+    return out
+
+
 @dataclass
 class TemporalWaveFunction:
     """
@@ -387,7 +624,39 @@ class TemporalWaveFunction:
     LAW XIV: CI threshold crossing = event manifestation
     """
     
-    octaves: Dict[TemporalOctave, float]  # Current phase in each octave
+    initial_octaves: InitVar[Optional[Dict[TemporalOctave, float]]] = None  # Initial phase per octave
+    z: np.ndarray = field(init=False)  # Unit phasor e^(iφ) per octave (_OCTAVE_INDEX order)
+    _steps: Dict[float, np.ndarray] = field(init=False, repr=False)  # Rotation per delta_days
+    _since_renorm: int = field(init=False, repr=False, default=0)
+    
+    def __post_init__(self, initial_octaves: Optional[Dict[TemporalOctave, float]]):
+        # Octaves not given start at phase 0
+        phases = np.zeros(len(_OCTAVE_INDEX))
+        for octave, phase in (initial_octaves or {}).items():
+            phases[_OCTAVE_INDEX[octave]] = phase
+        
+        self.z = np.exp(1j * phases)
+        self._steps = {}
+    
+    @property
+    def phases(self) -> np.ndarray:
+        """Current phase in each octave, in [0, 2π)"""
+        return np.mod(np.angle(self.z), _TWO_PI)
+    
+    @property
+    def octave_phases(self) -> Dict[TemporalOctave, float]:
+        """Current phase keyed by octave"""
+        return {octave: float(self.phases[i]) for octave, i in _OCTAVE_INDEX.items()}
+    
+    @property
+    def octaves(self) -> Dict[TemporalOctave, float]:
+        """
+        Current phase keyed by octave (same as octave_phases).
+        
+        Read-only: the returned dict is a snapshot, so assigning into it
+        does not move the wave function.
+        """
+        return self.octave_phases
     
     def calculate_wave_tension(self) -> float:
         """
@@ -395,43 +664,57 @@ class TemporalWaveFunction:
         
         High tension = imminent collapse
         """
-        tensions = []
-        
-        for octave, phase in self.octaves.items():
-            # Tension peaks when phase approaches π (opposition)
-            # and 2π (conjunction/completion)
-            tension = abs(np.sin(phase))
-            
-            # Weight by octave importance
-            weight = octave.value / 9.0
-            
-            tensions.append(tension * weight)
-        
-        return sum(tensions) / len(tensions)
+        # Tension peaks when phase approaches π (opposition)
+        # and 2π (conjunction/completion), weighted by octave importance.
+        # |sin(φ)| is |Im(z)| on the unit circle.
+        if NUMBA_AVAILABLE:
+            return _wave_tension_kernel(self.z.imag)
+        return float((np.abs(self.z.imag) * _OCTAVE_WEIGHTS).mean())
     
     def advance_time(self, delta_days: float):
         """
         Evolve all octaves forward in time.
         
-        Different octaves move at different rates.
-        """
-        octave_periods = {
-            TemporalOctave.LUNAR: 28,
-            TemporalOctave.MERCURIAL: 88,
-            TemporalOctave.VENUSIAN: 225,
-            TemporalOctave.MARTIAN: 687,
-            TemporalOctave.JOVIAN: 4333,    # ~12 years
-            TemporalOctave.SATURNIAN: 10592,  # ~29 years
-            TemporalOctave.URANIAN: 30687,   # ~84 years
-            TemporalOctave.NEPTUNIAN: 60266,  # ~165 years
-            TemporalOctave.PLUTONIAN: 90553   # ~248 years
-        }
+        Different octaves move at different rates. Each step rotates the
+        phasors by e^(iωΔt), computed once per distinct delta_days, so
+        phases never pass through a large angle and a modulo.
+        """
+        step = self._steps.get(delta_days)
+        if step is None:
+            step = np.exp(1j * _OCTAVE_ANGULAR_VELOCITY * delta_days)
+            if len(self._steps) < _MAX_CACHED_STEPS:
+                self._steps[delta_days] = step
+        
+        self.z *= step
         
-        for octave in self.octaves:
-            period = octave_periods[octave]
-            angular_velocity = 2 * np.pi / period
-            self.octaves[octave] += angular_velocity * delta_days
-            self.octaves[octave] %= (2 * np.pi)  # Wrap to [0, 2π]
+        self._since_renorm += 1
+        if self._since_renorm >= _RENORM_INTERVAL:
+            self.z /= np.abs(self.z)
+            self._since_renorm = 0
+    
+    def advance_time_batch(self, delta_days: np.ndarray) -> np.ndarray:
+        """
+        Apply a sequence of advance_time steps in one pass.
+        
+        Returns:
+            Phase trajectory of shape (T, 9), row t being the phases after
+            step t; the wave function ends at the last row.
+        """
+        cum = np.cumsum(np.asarray(delta_days, dtype=np.float64))[:, None]  # (T, 1)
+        traj = np.mod(self.phases[None, :] + _OCTAVE_ANGULAR_VELOCITY[None, :] * cum, _TWO_PI)
+        
+        if len(traj):
+            self.z = np.exp(1j * traj[-1])
+            self._since_renorm = 0
+        
+        return traj
+    
+    @staticmethod
+    def calculate_wave_tension_batch(traj: np.ndarray) -> np.ndarray:
+        """Wave tension for each row of a (T, 9) phase trajectory"""
+        if NUMBA_AVAILABLE:
+            return _wave_tension_batch_kernel(np.asarray(traj, dtype=np.float64))
+        return np.abs(np.sin(traj)).dot(_OCTAVE_WEIGHTS) / len(_OCTAVE_WEIGHTS)
     
     def is_event_window(self, threshold: float = 0.8) -> bool:
         """
@@ -447,6 +730,16 @@ class TemporalWaveFunction:
 # "No field can express outside its grammatical parameters."
 # ============================================================================
 
+# Dimension each Element must express through, indexed by Element.value - 1
+_BASE_DIMENSIONS = (
+    'Movement',   # FIRE
+    'Evolution',  # EARTH
+    'Being',      # MATTER
+    'Design',     # WATER
+    'Space'       # AETHER
+)
+
+
 @dataclass
 class GrammaticalBoundary:
     """
@@ -490,15 +783,7 @@ class GrammaticalBoundary:
     
     def _dimension_matches_base(self) -> bool:
         """Base and Dimension must be aligned"""
-        base_dimension_map = {
-            Element.FIRE: 'Movement',
-            Element.EARTH: 'Evolution',
-            Element.MATTER: 'Being',
-            Element.WATER: 'Design',
-            Element.AETHER: 'Space'
-        }
-        
-        return base_dimension_map.get(self.base) == self.dimension
+        return _BASE_DIMENSIONS[self.base.value - 1] == self.dimension
     
     def _line_grammar_valid(self, syntax: str) -> bool:
         """Each line has specific syntactic structure"""
@@ -516,8 +801,13 @@ class GrammaticalBoundary:
         
         LAW XV: Violations create "contradiction debt"
         """
-        # Distortion cost increases exponentially
-        return np.exp(violation_severity) - 1
+        # Distortion cost increases exponentially (e^x - 1, exact near 0)
+        return math.expm1(violation_severity)
+    
+    @staticmethod
+    def calculate_distortion_cost_batch(violation_severities: np.ndarray) -> np.ndarray:
+        """calculate_distortion_cost for an array of severities"""
+        return np.expm1(np.asarray(violation_severities, dtype=np.float64))
 
 
 # ============================================================================
@@ -531,12 +821,23 @@ class ConstitutionalEngine:
     This is the Supreme Court of the consciousness physics system.
     """
     
-    def __init__(self):
+    def __init__(self, cache_size: int = 8192):
         self.elemental_validator = ElementalValidator()
         self.harmonic_hierarchy = HarmonicHierarchy()
-        self.temporal_waves = TemporalWaveFunction(octaves={
+        self.temporal_waves = TemporalWaveFunction(initial_octaves={
             octave: 0.0 for octave in TemporalOctave
         })
+        
+        # Memoized time-independent checks of validate_collapse, keyed by
+        # the input fingerprint (call clear_cache() after swapping validators)
+        self._static_checks = functools.lru_cache(maxsize=cache_size)(self._run_static_checks)
+        
+        # Reusable (field_components, phase_angles) buffers by length
+        self._resonance_scratch: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+    
+    def clear_cache(self):
+        """Drop memoized validation results"""
+        self._static_checks.cache_clear()
     
     def validate_collapse(self,
                          base: Element,
@@ -547,15 +848,122 @@ class ConstitutionalEngine:
                          tone: int,
                          planet: str,
                          proposed_meaning: str,
-                         context: Dict) -> Tuple[bool, Dict]:
+                         context: Dict,
+                         resonance: Optional[ResonanceField] = None) -> Tuple[bool, Dict]:
         """
         Full constitutional validation of a proposed collapse.
         
-        Enforces Laws XI-XIV.
+        Enforces Laws XI-XIV. A prebuilt ResonanceField may be passed in
+        place of context['field_components'] / context['phase_angles'];
+        such calls are not memoized.
         
         Returns:
             (is_valid, detailed_report)
         """
+        if resonance is not None:
+            passed, sections = self._run_static_checks(
+                base, dimension, gate, line, color, tone, planet, proposed_meaning,
+                None, None, resonance
+            )
+        else:
+            key = (
+                base, dimension, gate, line, color, tone, planet, proposed_meaning,
+                _fingerprint(context.get('field_components', [1.0])),
+                _fingerprint(context.get('phase_angles', [0.0]))
+            )
+            try:
+                passed, sections = self._static_checks(*key)
+            except TypeError:
+                # Unhashable inputs bypass the cache
+                passed, sections = self._run_static_checks(*key)
+        
+        # Fresh section dicts so callers never mutate cached results
+        report = {name: dict(section) for name, section in sections.items()
+                  if name != 'grammar'}
+        
+        if not passed:
+            return False, report
+        
+        # LAW XIV: Temporal Wave Integrity (time-dependent, never cached)
+        wave_tension = self.temporal_waves.calculate_wave_tension()
+        in_event_window = self.temporal_waves.is_event_window()
+        
+        report['temporal'] = {
+            'wave_tension': wave_tension,
+            'in_event_window': in_event_window
+        }
+        
+        # LAW XV: Constitutional Containment
+        report['grammar'] = dict(sections['grammar'])
+        
+        # All laws satisfied (elemental and resonance already passed)
+        return report['grammar']['valid'], report
+    
+    def validate_collapse_batch(self, candidates: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Validity of many proposed collapses in one vectorized pass.
+        
+        candidates maps column names to aligned arrays: base (Element
+        values 1-5), dimension, gate, line, color, tone, and optionally
+        proposed_meaning plus (N, K) field_components / phase_angles
+        matrices (default: one unit component at phase 0). A structured
+        array with those fields works too.
+        
+        Returns:
+            Boolean array, equal to validate_collapse(...)[0] for each row
+        """
+        bases = np.asarray(candidates['base'], dtype=np.int64)
+        names = candidates.dtype.names if hasattr(candidates, 'dtype') else candidates
+        
+        # LAW XI: Elemental Objectivity (hooks run once per distinct meaning)
+        validator = self.elemental_validator
+        if 'proposed_meaning' in names:
+            meanings = np.asarray(candidates['proposed_meaning'], dtype=object)
+            unique, inverse = np.unique(meanings, return_inverse=True)
+            exhibited = np.array([validator._exhibited_behaviors(m) for m in unique],
+                                 dtype=np.uint64)[inverse]
+            satisfied = np.array([validator._satisfied_requirements(m) for m in unique],
+                                 dtype=np.uint64)[inverse]
+        else:
+            exhibited = satisfied = None
+        
+        valid = validator.validate_collapse_vec(
+            bases, candidates['color'], candidates['tone'],
+            candidates['line'], candidates['gate'], exhibited, satisfied
+        )
+        
+        # LAW XII: Resonant Legitimacy
+        if 'field_components' in names:
+            coherence = ResonanceField.calculate_coherence_batch(
+                candidates['field_components'], candidates['phase_angles']
+            )
+            valid &= coherence > 0.7
+        
+        # LAW XV: Constitutional Containment (line grammar and color checks
+        # are still placeholders that always pass)
+        dimensions = np.asarray(candidates['dimension'], dtype=object)
+        valid &= np.asarray(_BASE_DIMENSIONS, dtype=object)[bases - 1] == dimensions
+        
+        return valid
+    
+    def _run_static_checks(self,
+                           base: Element,
+                           dimension: str,
+                           gate: int,
+                           line: int,
+                           color: int,
+                           tone: int,
+                           planet: str,
+                           proposed_meaning: str,
+                           field_components,
+                           phase_angles,
+                           resonance_field: Optional[ResonanceField] = None) -> Tuple[bool, Dict]:
+        """
+        Laws XI, XII, XIII and XV for validate_collapse.
+        
+        Returns (passed, sections); passed is False when validation stops
+        early at the elemental or resonance check.
+        """
         report = {}
         
         # LAW XI: Elemental Objectivity
@@ -571,13 +979,8 @@ class ConstitutionalEngine:
             return False, report
         
         # LAW XII: Resonant Legitimacy
-        field_components = context.get('field_components', [1.0])
-        phase_angles = context.get('phase_angles', [0.0])
-        
-        resonance_field = ResonanceField(
-            field_components=field_components,
-            phase_angles=phase_angles
-        )
+        if resonance_field is None:
+            resonance_field = self._scratch_resonance_field(field_components, phase_angles)
         
         has_resonant_authority = resonance_field.has_authority()
         report['resonance'] = {
@@ -590,7 +993,7 @@ class ConstitutionalEngine:
         
         # LAW XIII: Harmonic Hierarchy
         planetary_weight = self.harmonic_hierarchy.calculate_planetary_emphasis(planet)
-        base_weight = self.harmonic_hierarchy.get_authority_weight('Base')
+        base_weight = self.harmonic_hierarchy.get_authority_weight(Layer.BASE)
         
         report['hierarchy'] = {
             'planetary_weight': planetary_weight,
@@ -598,15 +1001,6 @@ class ConstitutionalEngine:
             'authority_valid': planetary_weight >= 0.3  # Minimum threshold
         }
         
-        # LAW XIV: Temporal Wave Integrity
-        wave_tension = self.temporal_waves.calculate_wave_tension()
-        in_event_window = self.temporal_waves.is_event_window()
-        
-        report['temporal'] = {
-            'wave_tension': wave_tension,
-            'in_event_window': in_event_window
-        }
-        
         # LAW XV: Constitutional Containment
         boundary = GrammaticalBoundary(
             base=base,
@@ -625,17 +1019,32 @@ class ConstitutionalEngine:
             'reason': grammar_reason
         }
         
-        if not grammar_valid:
-            return False, report
+        return True, report
+    
+    def _scratch_resonance_field(self, field_components, phase_angles) -> ResonanceField:
+        """
+        ResonanceField over reused buffers of matching length.
         
-        # All laws satisfied
-        overall_valid = (
-            elemental_valid and
-            has_resonant_authority and
-            grammar_valid
-        )
+        Only valid until the next call; inputs that aren't two equal-length
+        flat sequences get a regular ResonanceField.
+        """
+        n = len(field_components)
+        if len(phase_angles) != n or np.ndim(field_components) != 1 or np.ndim(phase_angles) != 1:
+            return ResonanceField(field_components=field_components, phase_angles=phase_angles)
+        
+        buffers = self._resonance_scratch.get(n)
+        if buffers is None:
+            buffers = self._resonance_scratch[n] = (np.empty(n), np.empty(n))
+        components_buf, phases_buf = buffers
+        np.copyto(components_buf, field_components)
+        np.copyto(phases_buf, phase_angles)
         
-        return overall_valid, report
+        return ResonanceField(field_components=components_buf, phase_angles=phases_buf)
+
+
+def _fingerprint(values) -> tuple:
+    """Hashable float tuple of a 1-D sequence (nested input stays unhashable)"""
+    return tuple(np.asarray(values, dtype=np.float64).tolist())
 
 
 # ============================================================================
@@ -50,18 +50,100 @@ REQUIREMENTS:
 """
 
 import numpy as np
+import itertools
+from collections import defaultdict, deque
 import cupy as cp  # GPU acceleration
 import torch
 import redis
 import psycopg2
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Callable
+import psycopg2.pool
+from psycopg2.extras import execute_values
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from enum import Enum
+import ast
+import base64
+import functools
 import hashlib
-import jwt
-from datetime import datetime, timedelta
+import hmac
+import json
+import pickle
+import threading
+import time
+from calendar import timegm
+from datetime import datetime, timedelta, timezone
 import logging
 
+try:
+    from blake3 import blake3 as _fast_hasher  # SIMD tree hash
+except ImportError:
+    from hashlib import sha256 as _fast_hasher
+
+
+def _as_record(obj: Any) -> Dict:
+    """Shallow field dict of a dataclass (slotted or not) or plain object"""
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    return dict(vars(obj))
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON fallback for NumPy values, enums, datetimes and dataclasses"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if is_dataclass(obj):
+        return _as_record(obj)
+    return str(obj)
+
+
+try:
+    import orjson
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, default=_json_default,
+                            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    _loads = orjson.loads
+except ImportError:
+    # Fall back to stdlib json (slower encode/decode)
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, default=_json_default).encode('utf-8')
+    _loads = json.loads
+
+
+# Format byte prefixed to every Redis blob so the encoding can change later
+_BLOB_V1 = b'\x01'
+
+
+def _pack(obj: Any) -> bytes:
+    """Versioned Redis blob"""
+    return _BLOB_V1 + _dumps(obj)
+
+
+def _unpack(blob: bytes) -> Optional[Any]:
+    """
+    Decode a Redis blob written by _pack.
+    
+    Older entries are bare JSON or a Python repr; the latter is read with
+    ast.literal_eval (never eval). Undecodable entries return None.
+    """
+    if blob[:1] == _BLOB_V1:
+        return _loads(blob[1:])
+    try:
+        return _loads(blob)
+    except ValueError:
+        pass
+    try:
+        return ast.literal_eval(blob.decode('utf-8'))
+    except (ValueError, SyntaxError, UnicodeDecodeError):
+        return None
+
 
 # ============================================================================
 # SECURITY: ZERO-TRUST CONFIGURATION
@@ -75,7 +157,7 @@ class SecurityLevel(Enum):
     PARANOID = 3      # Every single law checked at every step
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TrustBoundary:
     """
     Zero-trust security boundary.
@@ -113,16 +195,35 @@ class TrustBoundary:
         logging.info(f"  Data hash: {self._hash_data(data)}")
     
     def _hash_data(self, data: Any) -> str:
-        """Create tamper-evident hash of data"""
-        data_str = str(data).encode('utf-8')
-        return hashlib.sha256(data_str).hexdigest()[:16]
+        """Create tamper-evident hash of data (BLAKE3 when available)"""
+        return _fast_hasher(_payload_bytes(data)).hexdigest()[:16]
+    
+    def _hash_data_sha256(self, data: Any) -> str:
+        """
+        SHA-256 variant of _hash_data for audits that require it.
+        
+        hashlib delegates to OpenSSL, which uses the CPU's SHA extensions
+        where present.
+        """
+        return hashlib.sha256(_payload_bytes(data)).hexdigest()[:16]
+
+
+def _payload_bytes(data: Any) -> bytes:
+    """Bytes to hash for data: raw bytes as-is, else pickled, else repr"""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return bytes(data)
+    try:
+        return pickle.dumps(data, protocol=5)
+    except Exception:
+        # Unpicklable payloads (lambdas, open handles, ...) fall back to repr
+        return str(data).encode('utf-8')
 
 
 # ============================================================================
 # NAMESPACE ISOLATION
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Namespace:
     """
     Isolated execution environment.
@@ -161,13 +262,81 @@ class Namespace:
         # In production, use proper secret key management
         secret = self.security_context.get('jwt_secret', 'INSECURE_DEV_KEY')
         
-        return jwt.encode(payload, secret, algorithm='HS256')
+        return _encode_hs256(payload, secret)
+
+
+# Compact JWS header, identical to jwt.encode(..., algorithm='HS256')
+_JWT_HS256_HEADER = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b'=')
+
+
+@functools.lru_cache(maxsize=32)
+def _signer_for(secret: str) -> 'hmac.HMAC':
+    """Keyed HMAC-SHA256 state, copied per token instead of re-keyed"""
+    return hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+
+
+def _encode_hs256(payload: Dict, secret: str) -> str:
+    """HS256 JWT compatible with PyJWT; datetime claims become NumericDates"""
+    claims = {
+        k: timegm(v.utctimetuple()) if isinstance(v, datetime) else v
+        for k, v in payload.items()
+    }
+    body = base64.urlsafe_b64encode(
+        json.dumps(claims, separators=(',', ':')).encode('utf-8')
+    ).rstrip(b'=')
+    signing_input = _JWT_HS256_HEADER + b'.' + body
+    
+    mac = _signer_for(secret).copy()
+    mac.update(signing_input)
+    signature = base64.urlsafe_b64encode(mac.digest()).rstrip(b'=')
+    
+    return (signing_input + b'.' + signature).decode('ascii')
 
 
 # ============================================================================
 # STATEFUL MEMORY PERSISTENCE
 # ============================================================================
 
+# Process-wide connection pools shared by every namespace's MemoryStore.
+# redis-py connects lazily; the Postgres pool opens its minimum connections
+# on creation, so it is built on first use.
+_REDIS_POOL = redis.ConnectionPool(host='localhost', port=6379, db=0, max_connections=64)
+_PG_POOL: Optional[psycopg2.pool.ThreadedConnectionPool] = None
+_PG_POOL_LOCK = threading.Lock()
+_SCHEMA_READY = False
+_SCHEMA_LOCK = threading.Lock()
+
+# Redis key scheme, formatted with str.format positional args
+KEY_TMPL = {
+    'ns_meta': 'ns:{}:meta',              # namespace_id
+    'chart': 'ns:{}:chart',               # namespace_id
+    'event': 'event:{}:{}:{}',            # namespace_id, event type, day bucket
+    'memory': '{}:memory:{}',             # namespace_id, trace timestamp
+    'attractor': '{}:attractor:{}',       # namespace_id, attractor name
+}
+
+# Redis TTLs in seconds; event streams use EngineConfig.event_retention_days
+TTL = {
+    'ns_meta': 300,
+    'chart': 3600,
+    'memory': 90 * 86400,       # Expire after 90 days
+    'attractor': 365 * 86400,   # Long-lived cache
+}
+
+_EVENT_BUCKET_NS = 86400 * 1_000_000_000  # One event stream per namespace/type/day
+
+
+def _get_pg_pool() -> psycopg2.pool.ThreadedConnectionPool:
+    global _PG_POOL
+    if _PG_POOL is None:
+        with _PG_POOL_LOCK:
+            if _PG_POOL is None:
+                _PG_POOL = psycopg2.pool.ThreadedConnectionPool(
+                    2, 32, "dbname=consciousness_engine user=admin"
+                )
+    return _PG_POOL
+
+
 class MemoryBackend(Enum):
     """Storage backend options"""
     REDIS = 'redis'        # Fast, in-memory
@@ -175,7 +344,7 @@ class MemoryBackend(Enum):
     HYBRID = 'hybrid'      # Redis + Postgres
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryStore:
     """
     Persistent storage for attractor memory traces.
@@ -185,28 +354,45 @@ class MemoryStore:
     
     backend: MemoryBackend
     redis_client: Optional[redis.Redis] = None
-    postgres_conn: Optional[Any] = None
+    postgres_pool: Optional[psycopg2.pool.ThreadedConnectionPool] = None
     namespace_id: str = ""
     
     def __post_init__(self):
-        """Initialize storage backend"""
+        """Attach to the process-wide connection pools"""
         if self.backend in [MemoryBackend.REDIS, MemoryBackend.HYBRID]:
             self.redis_client = redis.Redis(
-                host='localhost',
-                port=6379,
-                db=0,
-                decode_responses=True
+                connection_pool=_REDIS_POOL,
+                decode_responses=False
             )
         
         if self.backend in [MemoryBackend.POSTGRES, MemoryBackend.HYBRID]:
-            self.postgres_conn = psycopg2.connect(
-                "dbname=consciousness_engine user=admin"
-            )
+            self.postgres_pool = _get_pg_pool()
             self._init_schema()
     
+    @contextmanager
+    def _postgres(self):
+        """Borrow a pooled Postgres connection; rolled back on error"""
+        conn = self.postgres_pool.getconn()
+        try:
+            yield conn
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.postgres_pool.putconn(conn)
+    
     def _init_schema(self):
-        """Create database schema if needed"""
-        with self.postgres_conn.cursor() as cur:
+        """Create database schema if needed (once per process)"""
+        global _SCHEMA_READY
+        if _SCHEMA_READY:
+            return
+        with _SCHEMA_LOCK:
+            if not _SCHEMA_READY:
+                self._create_tables()
+                _SCHEMA_READY = True
+    
+    def _create_tables(self):
+        with self._postgres() as conn, conn.cursor() as cur:
             cur.execute("""
                 CREATE TABLE IF NOT EXISTS memory_traces (
                     id SERIAL PRIMARY KEY,
@@ -233,7 +419,7 @@ class MemoryStore:
                 )
             """)
             
-            self.postgres_conn.commit()
+            conn.commit()
     
     def save_memory_trace(self, trace: 'MemoryTrace'):
         """
@@ -241,36 +427,51 @@ class MemoryStore:
         
         LAW VIII: Every collapse leaves residue.
         """
-        key = f"{self.namespace_id}:memory:{trace.timestamp}"
+        self.save_memory_traces([trace])
+    
+    def save_memory_traces(self, traces: List['MemoryTrace']):
+        """
+        Persist a burst of memory traces with one round trip per backend.
+        
+        Redis writes go through a non-transactional pipeline; Postgres rows
+        go through execute_values and a single commit.
+        """
+        if not traces:
+            return
         
         # Fast write to Redis
         if self.redis_client:
-            self.redis_client.setex(
-                key,
-                timedelta(days=90),  # Expire after 90 days
-                str(trace.__dict__)
-            )
+            with self.redis_client.pipeline(transaction=False) as pipe:
+                for trace in traces:
+                    pipe.setex(
+                        KEY_TMPL['memory'].format(self.namespace_id, trace.timestamp),
+                        TTL['memory'],
+                        _pack(_as_record(trace))
+                    )
+                pipe.execute()
         
         # Durable write to Postgres
-        if self.postgres_conn:
-            with self.postgres_conn.cursor() as cur:
-                cur.execute("""
+        if self.postgres_pool:
+            rows = [(
+                self.namespace_id,
+                trace.attractor_name,
+                trace.collapsed_state,
+                trace.resonance_score,
+                trace.timestamp,
+                _dumps(trace.context).decode('utf-8'),
+                trace.gravity_before,
+                trace.gravity_after
+            ) for trace in traces]
+            
+            with self._postgres() as conn, conn.cursor() as cur:
+                execute_values(cur, """
                     INSERT INTO memory_traces 
                     (namespace_id, attractor_name, collapsed_state, 
                      resonance_score, timestamp, context, 
                      gravity_before, gravity_after)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
-                    self.namespace_id,
-                    trace.attractor_name,
-                    trace.collapsed_state,
-                    trace.resonance_score,
-                    trace.timestamp,
-                    str(trace.context),
-                    trace.gravity_before,
-                    trace.gravity_after
-                ))
-                self.postgres_conn.commit()
+                    VALUES %s
+                """, rows, page_size=1000)
+                conn.commit()
     
     def load_attractor_state(self, attractor_name: str) -> Optional[Dict]:
         """
@@ -280,14 +481,16 @@ class MemoryStore:
         """
         # Try Redis first (fast)
         if self.redis_client:
-            key = f"{self.namespace_id}:attractor:{attractor_name}"
+            key = KEY_TMPL['attractor'].format(self.namespace_id, attractor_name)
             cached = self.redis_client.get(key)
             if cached:
-                return eval(cached)  # In production, use proper deserialization
+                state = _unpack(cached)
+                if state is not None:
+                    return state
         
         # Fallback to Postgres
-        if self.postgres_conn:
-            with self.postgres_conn.cursor() as cur:
+        if self.postgres_pool:
+            with self._postgres() as conn, conn.cursor() as cur:
                 cur.execute("""
                     SELECT gravity_strength, field_distribution, last_updated
                     FROM attractor_states
@@ -314,16 +517,16 @@ class MemoryStore:
         
         # Redis (cache)
         if self.redis_client:
-            key = f"{self.namespace_id}:attractor:{attractor_name}"
+            key = KEY_TMPL['attractor'].format(self.namespace_id, attractor_name)
             self.redis_client.setex(
                 key,
-                timedelta(days=365),  # Long-lived cache
-                str(state)
+                TTL['attractor'],
+                _pack(state)
             )
         
         # Postgres (source of truth)
-        if self.postgres_conn:
-            with self.postgres_conn.cursor() as cur:
+        if self.postgres_pool:
+            with self._postgres() as conn, conn.cursor() as cur:
                 cur.execute("""
                     INSERT INTO attractor_states 
                     (namespace_id, attractor_name, gravity_strength, 
@@ -338,10 +541,10 @@ class MemoryStore:
                     self.namespace_id,
                     attractor_name,
                     state['gravity_strength'],
-                    str(state['field_distribution']),
+                    _dumps(state['field_distribution']).decode('utf-8'),
                     timestamp
                 ))
-                self.postgres_conn.commit()
+                conn.commit()
 
 
 # ============================================================================
@@ -361,14 +564,20 @@ class EventType(Enum):
     TEMPORAL_WAVE_PEAK = 'temporal.wave_peak'
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Event:
     """System event with full context"""
     event_type: EventType
     namespace_id: str
-    timestamp: datetime
+    timestamp: int  # time.time_ns(): nanoseconds since the epoch
     data: Dict
     metadata: Dict = field(default_factory=dict)
+    
+    @property
+    def occurred_at(self) -> datetime:
+        """Timestamp as an aware UTC datetime (converted on demand)"""
+        seconds, nanos = divmod(self.timestamp, 1_000_000_000)
+        return datetime.fromtimestamp(seconds, tz=timezone.utc) + timedelta(microseconds=nanos // 1000)
 
 
 class EventBus:
@@ -376,11 +585,38 @@ class EventBus:
     Event streaming and hook system.
     
     Allows external systems to react to consciousness events.
+    
+    Threading: delivery is synchronous on the publishing thread. Each
+    thread has its own delivery queue, so a publish returns only after its
+    event (and anything its handlers publish in turn) has been handed to
+    every subscriber, regardless of what other threads are delivering.
+    Handlers may therefore run concurrently on different threads.
     """
     
-    def __init__(self):
-        self.subscribers: Dict[EventType, List[Callable]] = {}
-        self.event_log: List[Event] = []
+    def __init__(self,
+                 max_log_size: int = 100_000,
+                 redis_client: Optional[redis.Redis] = None,
+                 stream_ttl_seconds: int = 90 * 86400):
+        # Optional durable replay: every event is XADDed to a capped,
+        # expiring Redis stream per namespace/type/day (see KEY_TMPL)
+        self.redis_client = redis_client
+        self.stream_ttl_seconds = stream_ttl_seconds
+        self._stream_maxlen = max_log_size
+        
+        # Copy-on-write handler tuples: publish iterates without locking
+        self.subscribers: Dict[EventType, Tuple[Callable, ...]] = {}
+        self._subscribe_lock = threading.Lock()
+        self.event_log: deque = deque(maxlen=max_log_size)  # Oldest events drop off
+        
+        # History indices, maintained on publish
+        def bucket() -> deque:
+            return deque(maxlen=max_log_size)
+        self._by_ns: Dict[str, deque] = defaultdict(bucket)
+        self._by_ns_type: Dict[Tuple[str, EventType], deque] = defaultdict(bucket)
+        
+        # Per-thread pump state: a queue of pending (event type, events)
+        # deliveries and whether this thread is already draining it
+        self._local = threading.local()
     
     def subscribe(self, event_type: EventType, handler: Callable):
         """
@@ -392,43 +628,149 @@ class EventBus:
             
             bus.subscribe(EventType.COLLAPSE_COMPLETED, on_collapse)
         """
-        if event_type not in self.subscribers:
-            self.subscribers[event_type] = []
-        
-        self.subscribers[event_type].append(handler)
+        with self._subscribe_lock:
+            self.subscribers[event_type] = self.subscribers.get(event_type, ()) + (handler,)
+    
+    def unsubscribe(self, event_type: EventType, handler: Callable):
+        """Remove a previously registered handler (no-op if absent)"""
+        with self._subscribe_lock:
+            handlers = list(self.subscribers.get(event_type, ()))
+            if handler not in handlers:
+                return
+            handlers.remove(handler)
+            if handlers:
+                self.subscribers[event_type] = tuple(handlers)
+            else:
+                del self.subscribers[event_type]
     
     def publish(self, event: Event):
         """
         Publish event to all subscribers.
         
         CRITICAL: This is how memory engine gets triggered.
+        
+        Events published from inside a handler are logged immediately but
+        delivered (on the same thread) after the current event's handlers
+        have all run.
         """
         # Log event
-        self.event_log.append(event)
+        self._record(event)
+        self._stream([event])
         logging.info(f"Event published: {event.event_type.value}")
         
         # Notify subscribers
-        handlers = self.subscribers.get(event.event_type, [])
-        for handler in handlers:
-            try:
-                handler(event)
-            except Exception as e:
-                logging.error(f"Event handler failed: {e}")
+        self._pump_queue().append((event.event_type, [event]))
+        self._pump()
+    
+    def publish_batch(self, events: List[Event]):
+        """
+        Publish many events with one dispatch per (event type, handler).
+        
+        Handlers marked with `handler.__batched__ = True` receive the list of
+        events of their type in a single call; other handlers are called
+        once per event. Events are delivered grouped by type, in publish
+        order within each type.
+        """
+        by_type: Dict[EventType, List[Event]] = {}
+        for event in events:
+            by_type.setdefault(event.event_type, []).append(event)
+        
+        for event in events:
+            self._record(event)
+        self._stream(events)
+        
+        queue = self._pump_queue()
+        for event_type, batch in by_type.items():
+            logging.info(f"Events published: {event_type.value} x{len(batch)}")
+            queue.append((event_type, batch))
+        
+        self._pump()
+    
+    def _pump_queue(self) -> deque:
+        """This thread's pending deliveries"""
+        local = self._local
+        try:
+            return local.queue
+        except AttributeError:
+            local.queue = deque()
+            local.pumping = False
+            return local.queue
+    
+    def _pump(self):
+        """
+        Drain this thread's queued deliveries, unless an outer publish on
+        this thread is already doing so (handlers that publish just enqueue).
+        """
+        local = self._local
+        if local.pumping:
+            return
+        
+        local.pumping = True
+        try:
+            queue = local.queue
+            while queue:
+                self._deliver(*queue.popleft())
+        finally:
+            local.pumping = False
+    
+    def _deliver(self, event_type: EventType, batch: List[Event]):
+        """Hand one type's events to its subscribers"""
+        for handler in self.subscribers.get(event_type, ()):
+            # Batched handlers (see publish_batch) always take a list
+            if getattr(handler, '__batched__', False):
+                try:
+                    handler(batch)
+                except Exception as e:
+                    logging.error(f"Event handler failed: {e}")
+                continue
+            
+            for event in batch:
+                try:
+                    handler(event)
+                except Exception as e:
+                    logging.error(f"Event handler failed: {e}")
+    
+    def _stream(self, events: List[Event]):
+        """Append events to their Redis replay streams in one round trip"""
+        if not self.redis_client or not events:
+            return
+        
+        try:
+            with self.redis_client.pipeline(transaction=False) as pipe:
+                for event in events:
+                    key = KEY_TMPL['event'].format(
+                        event.namespace_id,
+                        event.event_type.value,
+                        event.timestamp // _EVENT_BUCKET_NS
+                    )
+                    pipe.xadd(key, {'event': _pack(_as_record(event))},
+                              maxlen=self._stream_maxlen, approximate=True)
+                    pipe.expire(key, self.stream_ttl_seconds)
+                pipe.execute()
+        except Exception as e:
+            # Streaming is best-effort; in-process delivery must not fail
+            logging.error(f"Event streaming failed: {e}")
+    
+    def _record(self, event: Event):
+        """Append event to the log and the history indices"""
+        self.event_log.append(event)
+        self._by_ns[event.namespace_id].append(event)
+        self._by_ns_type[(event.namespace_id, event.event_type)].append(event)
     
     def get_event_history(self, 
                          namespace_id: str,
                          event_type: Optional[EventType] = None,
                          limit: int = 100) -> List[Event]:
-        """Query event history"""
-        filtered = [
-            e for e in self.event_log 
-            if e.namespace_id == namespace_id
-        ]
-        
+        """Query event history (most recent `limit` events, oldest first)"""
         if event_type:
-            filtered = [e for e in filtered if e.event_type == event_type]
+            source = self._by_ns_type.get((namespace_id, event_type), ())
+        else:
+            source = self._by_ns.get(namespace_id, ())
+        
+        recent = list(itertools.islice(reversed(source), max(limit, 0)))
+        recent.reverse()
         
-        return filtered[-limit:]
+        return recent
 
 
 # ============================================================================
@@ -452,6 +794,9 @@ class GPUAccelerator:
     def __init__(self, backend: ComputeBackend = ComputeBackend.AUTO):
         self.backend = self._select_backend(backend)
         self.device = self._get_device()
+        
+        # Tensor-core friendly default on GPU; full precision on CPU
+        self.dtype = torch.bfloat16 if self.backend == ComputeBackend.CUDA else torch.float32
     
     def _select_backend(self, backend: ComputeBackend) -> ComputeBackend:
         """Auto-detect best available backend"""
@@ -467,10 +812,9 @@ class GPUAccelerator:
             return torch.device('cuda')
         return torch.device('cpu')
     
-    def to_tensor(self, array: np.ndarray) -> torch.Tensor:
-        """Convert numpy to GPU tensor"""
-        tensor = torch.from_numpy(array).float()
-        return tensor.to(self.device)
+    def to_tensor(self, array: np.ndarray, dtype: Optional['torch.dtype'] = None) -> torch.Tensor:
+        """Convert numpy to GPU tensor (in self.dtype unless dtype is given)"""
+        return torch.from_numpy(array).to(self.device, dtype=dtype or self.dtype)
     
     def calculate_interference_batch(self,
                                      wave_batch: torch.Tensor) -> torch.Tensor:
@@ -486,28 +830,52 @@ class GPUAccelerator:
         Returns:
             interference_patterns: Shape (batch_size, num_points)
         """
-        # Superposition: sum across dimension axis
-        total_waves = torch.sum(wave_batch, dim=1)
+        # Superposition: sum across dimension axis (keeping the input dtype)
+        total_waves = torch.sum(wave_batch, dim=1, dtype=wave_batch.dtype)
         
-        # Standing wave intensity: |ψ|²
-        interference = torch.abs(total_waves) ** 2
+        # Standing wave intensity: |ψ|² = re² + im², without abs's sqrt
+        if total_waves.is_complex():
+            interference = total_waves.real.square() + total_waves.imag.square()
+        else:
+            interference = total_waves.square()
         
         return interference
     
     def calculate_resonance_matrix(self,
-                                   attractors: torch.Tensor) -> torch.Tensor:
+                                   attractors: torch.Tensor,
+                                   block: int = 4096) -> torch.Tensor:
         """
         GPU-accelerated resonance calculation between all attractor pairs.
         
+        The matrix is symmetric, so it is filled in block x block tiles over
+        the upper triangle and mirrored; only one tile product is live at a
+        time besides the output.
+        
         Args:
             attractors: Shape (num_attractors, gravity_dim)
+            block: Tile edge length
         
         Returns:
             resonance_matrix: Shape (num_attractors, num_attractors)
         """
-        # Cosine similarity as resonance measure
-        attractors_norm = torch.nn.functional.normalize(attractors, dim=1)
-        resonance = torch.mm(attractors_norm, attractors_norm.t())
+        n = attractors.shape[0]
+        use_autocast = self.backend == ComputeBackend.CUDA
+        out_dtype = torch.bfloat16 if use_autocast else attractors.dtype
+        resonance = torch.empty(n, n, dtype=out_dtype, device=attractors.device)
+        
+        # Cosine similarity as resonance measure; on CUDA the GEMMs run in
+        # bf16 on tensor cores with fp32 accumulation
+        with torch.autocast(self.device.type, dtype=torch.bfloat16,
+                            enabled=use_autocast):
+            attractors_norm = torch.nn.functional.normalize(attractors, dim=1)
+            
+            for i in range(0, n, block):
+                rows = attractors_norm[i:i + block]
+                for j in range(i, n, block):
+                    tile = torch.mm(rows, attractors_norm[j:j + block].t())
+                    resonance[i:i + block, j:j + block] = tile
+                    if i != j:
+                        resonance[j:j + block, i:i + block] = tile.t()
         
         return resonance
 
@@ -516,7 +884,7 @@ class GPUAccelerator:
 # COMPLETE SYSTEM INTEGRATION
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class EngineConfig:
     """Complete engine configuration"""
     
@@ -544,6 +912,17 @@ class EngineConfig:
     event_retention_days: int = 90
 
 
+@functools.lru_cache(maxsize=4096)
+def _namespace_id(owner_id: str) -> str:
+    """
+    Stable namespace ID for an owner.
+    
+    Stays on truncated SHA-256: the ID keys persisted Redis/Postgres rows,
+    so a different hash would orphan existing namespaces.
+    """
+    return f"ns_{hashlib.sha256(owner_id.encode()).digest()[:8].hex()}"
+
+
 class ConsciousnessEngine:
     """
     Complete production-grade consciousness physics engine.
@@ -560,7 +939,14 @@ class ConsciousnessEngine:
         self.config = config
         
         # Initialize components
-        self.event_bus = EventBus()
+        stream_to_redis = (
+            config.enable_event_streaming
+            and config.memory_backend in [MemoryBackend.REDIS, MemoryBackend.HYBRID]
+        )
+        self.event_bus = EventBus(
+            redis_client=redis.Redis(connection_pool=_REDIS_POOL) if stream_to_redis else None,
+            stream_ttl_seconds=config.event_retention_days * 86400
+        )
         self.gpu = GPUAccelerator(config.compute_backend) if config.enable_gpu else None
         
         # Namespace registry
@@ -582,7 +968,7 @@ class ConsciousnessEngine:
         
         Each namespace has its own memory store and security context.
         """
-        namespace_id = f"ns_{hashlib.sha256(owner_id.encode()).hexdigest()[:16]}"
+        namespace_id = _namespace_id(owner_id)
         
         memory_store = MemoryStore(
             backend=self.config.memory_backend,
@@ -600,16 +986,44 @@ class ConsciousnessEngine:
         
         self.namespaces[namespace_id] = namespace
         
+        # Cache namespace metadata and chart under the shared key scheme
+        if memory_store.redis_client:
+            with memory_store.redis_client.pipeline(transaction=False) as pipe:
+                pipe.setex(KEY_TMPL['ns_meta'].format(namespace_id), TTL['ns_meta'],
+                           _pack({'owner_id': owner_id, 'created_at': namespace.created_at}))
+                pipe.setex(KEY_TMPL['chart'].format(namespace_id), TTL['chart'],
+                           _pack(chart_data))
+                pipe.execute()
+        
         # Publish event
         self.event_bus.publish(Event(
             event_type=EventType.NAMESPACE_CREATED,
             namespace_id=namespace_id,
-            timestamp=datetime.utcnow(),
+            timestamp=time.time_ns(),
             data={'owner_id': owner_id}
         ))
         
         return namespace
     
+    def delete_namespace(self, namespace_id: str) -> bool:
+        """
+        Drop a namespace and invalidate its cached metadata and chart.
+        
+        Event streams and memory traces are left to expire via their TTLs.
+        """
+        namespace = self.namespaces.pop(namespace_id, None)
+        if namespace is None:
+            return False
+        
+        redis_client = namespace.memory_store.redis_client
+        if redis_client:
+            redis_client.delete(
+                KEY_TMPL['ns_meta'].format(namespace_id),
+                KEY_TMPL['chart'].format(namespace_id)
+            )
+        
+        return True
+    
     def _setup_boundaries(self) -> List[TrustBoundary]:
         """Setup zero-trust validation boundaries"""
         boundaries = [
@@ -690,7 +1104,7 @@ if __name__ == "__main__":
     engine.event_bus.publish(Event(
         event_type=EventType.COLLAPSE_COMPLETED,
         namespace_id=namespace.namespace_id,
-        timestamp=datetime.utcnow(),
+        timestamp=time.time_ns(),
         data={'collapsed_meaning': 'test'}
     ))
     
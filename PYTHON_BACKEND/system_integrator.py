@@ -11,18 +11,114 @@ Implements:
 This is the interface layer that makes the physics USABLE.
 """
 
+import bisect
+import functools
+import math
 import numpy as np
 from typing import Dict, List, Optional, Tuple, Any, Literal
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 import json
 
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
 
 # ============================================================================
 # THE SENTENCE STRUCTURE SYSTEM
 # ============================================================================
 
-@dataclass
+_DIMENSIONS = ('Being', 'Evolution', 'Movement', 'Design', 'Space')
+_ZODIAC_SIGNS = ('Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
+                 'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces')
+
+_DIM_IDX = {name: i for i, name in enumerate(_DIMENSIONS)}
+_ZOD_IDX = {name: i for i, name in enumerate(_ZODIAC_SIGNS)}
+
+_DIMENSION_VERBS = {
+    'Being': "I Am",
+    'Evolution': "I Remember",
+    'Movement': "I Define",
+    'Design': "I Design",
+    'Space': "I Think"
+}
+
+# Generic line archetypes, used when no coordinate names the exact gate/line
+_LINE_NAMES = {
+    1: "Investigator",
+    2: "Hermit",
+    3: "Martyr",
+    4: "Opportunist",
+    5: "Heretic",
+    6: "Role Model"
+}
+
+_UNKNOWN_CENTER = "Unknown"
+
+# Weighted Euclidean distance
+# (different dimensions have different importance)
+_WEIGHTS = np.array([
+    2.0,   # Dimension (high importance)
+    1.5,   # Gate
+    1.0,   # Line
+    1.2,   # Color
+    1.0,   # Tone
+    1.5,   # Base (elemental substrate is critical)
+    0.5,   # Degree
+    0.3,   # Minute
+    0.1,   # Second
+    0.8,   # House
+    0.6    # Zodiac
+])
+_WEIGHTS.flags.writeable = False
+
+_VECTOR_SIZE = len(_WEIGHTS)
+
+# Vector columns holding whole numbers
+_INTEGRAL_COLUMNS = [0, 1, 2, 3, 4, 5, 9, 10]
+
+_COLOR_MOTIVATIONS = {
+    1: "driven by fear",
+    2: "seeking hope",
+    3: "desiring connection",
+    4: "needing to be needed",
+    5: "burdened by guilt",
+    6: "trusting innocence"
+}
+
+_TONE_MECHANISMS = {
+    1: "through direct smell/survival instinct",
+    2: "through taste/uncertainty navigation",
+    3: "through outer vision/action orientation",
+    4: "through meditation/inner reflection",
+    5: "through feeling/emotional awareness",
+    6: "through touch/material grounding"
+}
+
+_BASE_SUBSTRATES = {
+    1: "expressing through individual definition",
+    2: "remembering through crystalline mind",
+    3: "being through material presence",
+    4: "designing through adaptive flow",
+    5: "thinking through emergent space"
+}
+
+# All 6 x 6 x 5 Color/Tone/Base motivation phrases
+_MOTIVATION_TABLE = {
+    (c, t, b): f"{motivation}, {mechanism}, {substrate}"
+    for c, motivation in _COLOR_MOTIVATIONS.items()
+    for t, mechanism in _TONE_MECHANISMS.items()
+    for b, substrate in _BASE_SUBSTRATES.items()
+}
+
+
+@dataclass(frozen=True, slots=True)
 class SentenceCoordinate:
     """
     A complete coordinate in consciousness space.
@@ -60,12 +156,21 @@ class SentenceCoordinate:
     # Planetary activation
     planet: str       # Sun, Mars, etc.
     
+    # Memoized derived forms (coordinates are immutable)
+    _sentence: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _vector: Optional[np.ndarray] = field(default=None, init=False, repr=False, compare=False)
+    
     def to_sentence(self) -> str:
         """
         Generate the lawful sentence of existence.
         
         This is not poetry — this is measurement result.
         """
+        if self._sentence is None:
+            object.__setattr__(self, '_sentence', self._build_sentence())
+        return self._sentence
+    
+    def _build_sentence(self) -> str:
         # Color/Tone/Base create motivation qualifier
         motivation = self._get_motivation_phrase()
         
@@ -86,37 +191,16 @@ class SentenceCoordinate:
         """
         Translate Color/Tone/Base into natural language motivation.
         
-        This samples from semantic field, not lookup table.
+        Phrases for every lawful Color/Tone/Base triple are precomputed.
         """
-        color_motivations = {
-            1: "driven by fear",
-            2: "seeking hope",
-            3: "desiring connection",
-            4: "needing to be needed",
-            5: "burdened by guilt",
-            6: "trusting innocence"
-        }
+        phrase = _MOTIVATION_TABLE.get((self.color, self.tone, self.base))
+        if phrase is not None:
+            return phrase
         
-        tone_mechanisms = {
-            1: "through direct smell/survival instinct",
-            2: "through taste/uncertainty navigation",
-            3: "through outer vision/action orientation",
-            4: "through meditation/inner reflection",
-            5: "through feeling/emotional awareness",
-            6: "through touch/material grounding"
-        }
-        
-        base_substrates = {
-            1: "expressing through individual definition",
-            2: "remembering through crystalline mind",
-            3: "being through material presence",
-            4: "designing through adaptive flow",
-            5: "thinking through emergent space"
-        }
-        
-        motivation = color_motivations.get(self.color, "")
-        mechanism = tone_mechanisms.get(self.tone, "")
-        substrate = base_substrates.get(self.base, "")
+        # Out-of-range substrate: blank the unknown parts
+        motivation = _COLOR_MOTIVATIONS.get(self.color, "")
+        mechanism = _TONE_MECHANISMS.get(self.tone, "")
+        substrate = _BASE_SUBSTRATES.get(self.base, "")
         
         return f"{motivation}, {mechanism}, {substrate}"
     
@@ -124,71 +208,101 @@ class SentenceCoordinate:
         """
         Convert sentence coordinate to mathematical vector.
         
-        This allows distance/similarity calculations.
-        """
-        vector = np.array([
-            # Dimensional (1-hot encoding)
-            ['Being', 'Evolution', 'Movement', 'Design', 'Space'].index(self.dimension),
-            
-            # Gate/Line (archetypal)
-            self.gate,
-            self.line,
-            
-            # Substrate (depth)
-            self.color,
-            self.tone,
-            self.base,
-            
-            # Temporal (precise location)
-            self.degree,
-            self.minute / 60.0,
-            self.second / 3600.0,
-            
-            # House (context)
-            self.house,
-            
-            # Zodiac (encoded)
-            ['Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
-             'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'].index(self.zodiac_sign)
-        ], dtype=float)
+        This allows distance/similarity calculations. The array is
+        computed once per coordinate and returned read-only.
+        """
+        if self._vector is None:
+            object.__setattr__(self, '_vector', self._build_vector())
+        return self._vector
+    
+    def _build_vector(self) -> np.ndarray:
+        vector = np.empty(_VECTOR_SIZE)
+        
+        # Dimensional (1-hot encoding)
+        vector[0] = _DIM_IDX[self.dimension]
+        
+        # Gate/Line (archetypal)
+        vector[1] = self.gate
+        vector[2] = self.line
+        
+        # Substrate (depth)
+        vector[3] = self.color
+        vector[4] = self.tone
+        vector[5] = self.base
         
+        # Temporal (precise location)
+        vector[6] = self.degree
+        vector[7] = self.minute / 60.0
+        vector[8] = self.second / 3600.0
+        
+        # House (context)
+        vector[9] = self.house
+        
+        # Zodiac (encoded)
+        vector[10] = _ZOD_IDX[self.zodiac_sign]
+        
+        vector.flags.writeable = False
         return vector
     
+    @classmethod
+    def from_vector(cls, vector: np.ndarray, *templates: 'SentenceCoordinate') -> 'SentenceCoordinate':
+        """
+        Decode a (possibly interpolated) vector back into a coordinate.
+        
+        Numeric fields are rounded to the nearest lawful value. The verb is
+        looked up from the decoded dimension. Center and line name are
+        taken from the first template with the same gate (and line), else
+        the center is "Unknown" and the line gets its generic archetype.
+        Only the planet is copied unconditionally from templates[0].
+        """
+        dimension = _DIMENSIONS[int(round(vector[0]))]
+        gate = int(round(vector[1]))
+        line = int(round(vector[2]))
+        
+        center = _UNKNOWN_CENTER
+        line_name = _LINE_NAMES.get(line, "")
+        for template in templates:
+            if template.gate == gate:
+                if center == _UNKNOWN_CENTER:
+                    center = template.center
+                if template.line == line:
+                    line_name = template.line_name
+                    break
+        
+        return replace(
+            templates[0],
+            dimension=dimension,
+            dimension_verb=_DIMENSION_VERBS[dimension],
+            center=center,
+            gate=gate,
+            line=line,
+            line_name=line_name,
+            color=int(round(vector[3])),
+            tone=int(round(vector[4])),
+            base=int(round(vector[5])),
+            degree=float(vector[6]),
+            minute=int(round(vector[7] * 60.0)),
+            second=int(round(vector[8] * 3600.0)),
+            house=int(round(vector[9])),
+            zodiac_sign=_ZODIAC_SIGNS[int(round(vector[10]))]
+        )
+    
     def calculate_distance(self, other: 'SentenceCoordinate') -> float:
         """
         Calculate consciousness-space distance between two states.
         
         This is the measurement that enables path-finding.
         """
-        v1 = self.to_vector()
-        v2 = other.to_vector()
-        
-        # Weighted Euclidean distance
-        # (different dimensions have different importance)
-        weights = np.array([
-            2.0,   # Dimension (high importance)
-            1.5,   # Gate
-            1.0,   # Line
-            1.2,   # Color
-            1.0,   # Tone
-            1.5,   # Base (elemental substrate is critical)
-            0.5,   # Degree
-            0.3,   # Minute
-            0.1,   # Second
-            0.8,   # House
-            0.6    # Zodiac
-        ])
-        
-        distance = np.sqrt(np.sum(weights * (v1 - v2)**2))
+        diff = self.to_vector() - other.to_vector()
         
-        return distance
+        return math.sqrt(float(_WEIGHTS @ (diff * diff)))
 
 
 # ============================================================================
 # PROBLEM-SOLUTION CALCULATOR
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ProblemState:
     """User's current state in consciousness space"""
     current_coordinate: SentenceCoordinate
@@ -203,7 +317,7 @@ class ProblemState:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SolutionPath:
     """Path from current state to desired state"""
     origin: SentenceCoordinate
@@ -252,17 +366,16 @@ class PathFinder:
         
         Uses A* algorithm in consciousness space.
         """
-        # Calculate direct distance
-        total_distance = current.calculate_distance(desired)
-        
         # Generate intermediate steps
         # (In production, this would use proper path-finding)
-        intermediate = self._generate_intermediate_steps(
+        intermediate, V = self._generate_intermediate_steps(
             current, desired, max_steps
         )
         
-        # Calculate rigidity
-        rigidity = self._calculate_rigidity(current, intermediate, desired)
+        # Direct distance and rigidity in one pass over the (n, 11) path
+        path = np.vstack((current.to_vector(), V, desired.to_vector()))
+        total_distance, rigidity = _path_metrics(path)
+        rigidity = self._normalize_rigidity(rigidity, len(path))
         
         return SolutionPath(
             origin=current,
@@ -275,74 +388,93 @@ class PathFinder:
     def _generate_intermediate_steps(self,
                                      origin: SentenceCoordinate,
                                      destination: SentenceCoordinate,
-                                     num_steps: int) -> List[SentenceCoordinate]:
+                                     num_steps: int) -> Tuple[List[SentenceCoordinate], np.ndarray]:
         """
         Generate intermediate transformation steps.
         
         Each step must be constitutionally valid.
+        
+        Returns:
+            (steps, V) where row i of V is the vector of steps[i]
         """
-        # Placeholder - would implement proper interpolation
-        # that respects constitutional laws
+        # Linear interpolation in vector space (simplified);
+        # constitutional validation of each step is still to come
+        if num_steps <= 0:
+            return [], np.empty((0, _VECTOR_SIZE))
         
-        steps = []
-        # Linear interpolation in vector space (simplified)
         v_origin = origin.to_vector()
         v_dest = destination.to_vector()
         
-        for i in range(1, num_steps + 1):
-            alpha = i / (num_steps + 1)
-            v_intermediate = (1 - alpha) * v_origin + alpha * v_dest
-            
-            # Convert back to coordinate (with validation)
-            # Placeholder - actual implementation would properly decode
-            steps.append(origin)  # Simplified
+        alphas = np.linspace(1 / (num_steps + 1), num_steps / (num_steps + 1), num_steps)
+        # v_origin + alpha * delta, exact wherever the endpoints agree
+        V = v_origin + alphas[:, None] * (v_dest - v_origin)
+        V[:, _INTEGRAL_COLUMNS] = np.rint(V[:, _INTEGRAL_COLUMNS])
+        # Minutes and seconds are stored as fractions of a degree
+        V[:, 7] = np.rint(V[:, 7] * 60.0) / 60.0
+        V[:, 8] = np.rint(V[:, 8] * 3600.0) / 3600.0
         
-        return steps
+        # Decode rows, labelling each from the nearer endpoint first
+        steps = [
+            SentenceCoordinate.from_vector(
+                row, *((origin, destination) if alpha <= 0.5 else (destination, origin))
+            )
+            for alpha, row in zip(alphas, V)
+        ]
+        
+        return steps, V
     
-    def _calculate_rigidity(self,
-                           origin: SentenceCoordinate,
-                           steps: List[SentenceCoordinate],
-                           destination: SentenceCoordinate) -> float:
+    def _normalize_rigidity(self, rigidity: float, path_length: int) -> float:
         """
-        Calculate how rigid/forced the path is.
+        Scale summed transition rigidity (see _path_metrics) to 0-1.
         
         Rigidity = constitutional violations + elemental conflicts
         
         Low rigidity = natural resonance
         High rigidity = forced transformation (will decay)
         """
-        rigidity = 0.0
-        
-        # Check each transition for constitutional compliance
-        all_coords = [origin] + steps + [destination]
-        
-        for i in range(len(all_coords) - 1):
-            current = all_coords[i]
-            next_step = all_coords[i + 1]
-            
-            # Elemental substrate changes are highest rigidity
-            if current.base != next_step.base:
-                rigidity += 0.5  # Major substrate shift
-            
-            # Dimensional changes are medium rigidity
-            if current.dimension != next_step.dimension:
-                rigidity += 0.3
-            
-            # Gate/Line changes are lower rigidity
-            if current.gate != next_step.gate:
-                rigidity += 0.1
-            
-            # Color/Tone adjustments are natural
-            if current.color != next_step.color:
-                rigidity += 0.05
-        
         # Normalize to 0-1
-        max_rigidity = len(all_coords) * 0.5
+        max_rigidity = path_length * 0.5
         normalized_rigidity = min(rigidity / max_rigidity, 1.0)
         
         return normalized_rigidity
 
 
+@njit('UniTuple(float64, 2)(float64[:, ::1])', cache=True)
+def _path_metrics(path):
+    """
+    (direct distance, summed transition rigidity) of an (n, 11) path.
+    
+    Rows run origin, steps..., destination in SentenceCoordinate.to_vector
+    layout; columns 5, 0, 1, 3 are base, dimension, gate and color.
+    """
+    n = path.shape[0]
+    
+    distance = 0.0
+    for j in range(path.shape[1]):
+        diff = path[0, j] - path[n - 1, j]
+        distance += _WEIGHTS[j] * diff * diff
+    
+    rigidity = 0.0
+    for i in range(n - 1):
+        # Elemental substrate changes are highest rigidity
+        if path[i, 5] != path[i + 1, 5]:
+            rigidity += 0.5  # Major substrate shift
+        
+        # Dimensional changes are medium rigidity
+        if path[i, 0] != path[i + 1, 0]:
+            rigidity += 0.3
+        
+        # Gate/Line changes are lower rigidity
+        if path[i, 1] != path[i + 1, 1]:
+            rigidity += 0.1
+        
+        # Color/Tone adjustments are natural
+        if path[i, 3] != path[i + 1, 3]:
+            rigidity += 0.05
+    
+    return math.sqrt(distance), rigidity
+
+
 # ============================================================================
 # AI BACKEND SELECTOR
 # ============================================================================
@@ -356,7 +488,7 @@ class AIBackend(Enum):
     SPECIALIZED_ORACLE = 'consciousness_oracle_v1'
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskProfile:
     """Characteristics of a task that determine best AI backend"""
     requires_reasoning: bool = False
@@ -414,6 +546,20 @@ class BackendSelector:
                 'cost_per_1k': 0.0  # Custom model
             }
         }
+        
+        # Dense scoring tables, one row per backend
+        self._backends = tuple(self.backend_capabilities)
+        self._cap_matrix = np.array([
+            [caps['reasoning'], caps['creativity'], caps['precision'], caps['speed']]
+            for caps in self.backend_capabilities.values()
+        ])
+        self._max_ctx = np.array([caps['max_context'] for caps in self.backend_capabilities.values()])
+        self._is_local = np.array(['LOCAL' in backend.name for backend in self._backends])
+        
+        # Selection depends only on the five requirement flags and on which
+        # context limits are exceeded, so it is memoized on exactly that
+        self._ctx_limits = sorted(set(self._max_ctx.tolist()))
+        self._select_cached = functools.lru_cache(maxsize=256)(self._select)
     
     def select_backend(self, task: TaskProfile) -> AIBackend:
         """
@@ -421,37 +567,44 @@ class BackendSelector:
         
         Returns backend with best capability match.
         """
-        scores = {}
-        
-        for backend, caps in self.backend_capabilities.items():
-            score = 0.0
-            
-            # Weight by requirements
-            if task.requires_reasoning:
-                score += caps['reasoning'] * 2.0
-            
-            if task.requires_creativity:
-                score += caps['creativity'] * 1.5
-            
-            if task.requires_precision:
-                score += caps['precision'] * 2.0
-            
-            if task.requires_speed:
-                score += caps['speed'] * 1.0
-            
-            # Check context size
-            if task.context_size > caps['max_context']:
-                score *= 0.1  # Heavily penalize if can't fit
-            
-            # Privacy requirement = must be local
-            if task.requires_privacy:
-                if 'LOCAL' not in backend.name:
-                    score *= 0.0
-            
-            scores[backend] = score
+        requirements = (
+            bool(task.requires_reasoning),
+            bool(task.requires_creativity),
+            bool(task.requires_precision),
+            bool(task.requires_speed),
+            bool(task.requires_privacy)
+        )
+        # Number of distinct context limits the task overflows
+        ctx_bucket = bisect.bisect_left(self._ctx_limits, task.context_size)
+        
+        return self._select_cached(requirements, ctx_bucket)
+    
+    def _select(self, requirements: Tuple[bool, ...], ctx_bucket: int) -> AIBackend:
+        """Score all backends for one (requirements, context bucket) key"""
+        requires_reasoning, requires_creativity, requires_precision, \
+            requires_speed, requires_privacy = requirements
+        
+        # Weight by requirements
+        weights = np.array([
+            2.0 * requires_reasoning,
+            1.5 * requires_creativity,
+            2.0 * requires_precision,
+            1.0 * requires_speed
+        ])
+        scores = self._cap_matrix @ weights
+        
+        # Check context size: the first ctx_bucket limits are too small
+        overflowed = self._max_ctx < (
+            self._ctx_limits[ctx_bucket] if ctx_bucket < len(self._ctx_limits) else np.inf
+        )
+        scores[overflowed] *= 0.1  # Heavily penalize if can't fit
+        
+        # Privacy requirement = must be local
+        if requires_privacy:
+            scores[~self._is_local] = 0.0
         
         # Return backend with highest score
-        return max(scores, key=scores.get)
+        return self._backends[int(scores.argmax())]
 
 
 # ============================================================================
@@ -465,7 +618,7 @@ class BuilderMode(Enum):
     ARTIFACT_CREATION = 'artifact_creation'  # Creates games/tools/visualizations
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildRequest:
     """Request to build something"""
     mode: BuilderMode